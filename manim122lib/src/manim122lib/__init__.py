@@ -1,5 +1,71 @@
-from .binary_tree import *
-from .chonk import *
-from .queue import *
+from typing import TYPE_CHECKING
+import importlib
+import sys
+import types
 
 __version__ = "0.1.0"
+
+# --- Lazy exports ---
+# Submodules, and manim with them, are only imported when one of their names is first
+# accessed, so `from manim122lib.configs import ...` or `from manim122lib.heap_core import ...`
+# never loads the rendering stack. `from manim122lib import *` still imports everything.
+_EXPORTS = {
+    "configs": ["BinaryTreeConfig", "default_config", "PriorityQueueConfig", "default_pq_config"],
+    "heap_core": ["HeapCore", "PriorityFn", "heapify_order", "COMPARE", "SWAP", "FILL", "EMPTY", "REPOSITION"],
+    "instrument": ["instrumented_run", "JsonlSink", "ListSink"],
+    "binary_tree": ["BinaryTreePrototypes", "BinaryTreeNode", "CollapsedNode", "SubtreeSummary", "Edge", "HeapArray", "MinHeap", "HeapTraceRenderer"],
+    "queue": ["QueueElement", "PriorityQueue"],
+    "chonk": ["Chonk"],
+    "label_cache": ["LabelCache", "label_cache", "cached_text"],
+    "playback": ["prune_noop_animations", "play_changed"],
+    "parallel": ["section_boundary"],
+    "reversing": ["SelectiveReversing"],
+    "recording": ["RecordingScene", "SceneCall"],
+}
+_MODULE_OF = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULE_OF)
+
+
+def __getattr__(name: str):
+    module = _MODULE_OF.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _Package(types.ModuleType):
+    # `label_cache` names both a submodule and the shared LabelCache it holds. Importing the
+    # submodule sets the package attribute to the module, so the instance is served by a
+    # property that ignores that assignment. Use `from manim122lib.label_cache import ...`
+    # for the module's other names.
+    @property
+    def label_cache(self):
+        return importlib.import_module(f"{__name__}.label_cache").label_cache
+
+    @label_cache.setter
+    def label_cache(self, value):
+        pass
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+if TYPE_CHECKING:
+    from .configs import BinaryTreeConfig, default_config, PriorityQueueConfig, default_pq_config
+    from .heap_core import HeapCore, PriorityFn, heapify_order, COMPARE, SWAP, FILL, EMPTY, REPOSITION
+    from .instrument import instrumented_run, JsonlSink, ListSink
+    from .binary_tree import BinaryTreePrototypes, BinaryTreeNode, CollapsedNode, SubtreeSummary, Edge, HeapArray, MinHeap, HeapTraceRenderer
+    from .queue import QueueElement, PriorityQueue
+    from .chonk import Chonk
+    from .label_cache import LabelCache, label_cache, cached_text
+    from .playback import prune_noop_animations, play_changed
+    from .parallel import section_boundary
+    from .reversing import SelectiveReversing
+    from .recording import RecordingScene, SceneCall
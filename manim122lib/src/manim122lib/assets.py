@@ -0,0 +1,56 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+import numpy as np
+from PIL import Image
+
+# --- Decoded image cache ---
+# Library images are decoded once per process. Each is also kept as pre-downscaled variants
+# (halved `level` times), so a small on-screen image does not hold the full-resolution
+# pixels. The cached arrays are read-only and shared by every mobject that uses them;
+# a mobject copies its array before changing pixels in place.
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+_images: Dict[Tuple[str, int], np.ndarray] = {}
+
+
+def asset_path(name: str) -> Path:
+    path = ASSETS_DIR / name
+    if not path.exists(): raise FileNotFoundError(f"No library asset named {name!r} in {ASSETS_DIR}.")
+    return path
+
+
+@lru_cache(maxsize=None)
+def image_size(name: str) -> Tuple[int, int]:
+    """(width, height) of an asset, read from its header without decoding it."""
+    with Image.open(asset_path(name)) as image:
+        return image.size
+
+
+def level_for(height: int, shown_rows: float) -> int:
+    """The most halvings of an image `height` rows tall that still keep at least shown_rows rows."""
+    level = 0
+    while height >> (level + 1) >= max(shown_rows, 1):
+        level += 1
+    return level
+
+
+def load_image(name: str, level: int = 0) -> np.ndarray:
+    """The RGBA pixels of an asset, halved `level` times. Decoded once per (name, level) and shared read-only."""
+    key = (name, level)
+    pixels = _images.get(key)
+    if pixels is None:
+        with Image.open(asset_path(name)) as image:
+            image = image.convert("RGBA")
+            if level > 0:
+                width, height = image.size
+                image = image.resize((max(width >> level, 1), max(height >> level, 1)), Image.Resampling.LANCZOS)
+            pixels = np.array(image)
+        pixels.flags.writeable = False
+        _images[key] = pixels
+    return pixels
+
+
+def clear_image_cache():
+    _images.clear()
+    image_size.cache_clear()
@@ -0,0 +1,185 @@
+from manim import *
+from dataclasses import dataclass, asdict, replace
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+import argparse
+import gc
+import json
+import math
+import random
+import sys
+import time
+import tracemalloc
+from .binary_tree import MinHeap, default_config
+from .queue import PriorityQueue, default_pq_config
+from .recording import RecordingScene
+
+# --- Benchmarks ---
+# Times the library's data-structure operations on a RecordingScene (see recording.py), so
+# every play is applied to its final state without rasterizing. Besides wall time, each
+# case reports what the operation costs a real render: scene.play calls, animated mobjects
+# (family members of every animation's mobject), peak Python memory while it ran
+# (tracemalloc) and the frames it renders at low quality. Results can be saved as a
+# baseline and later runs compared against it.
+
+LOW_QUALITY_FPS = QUALITIES["low_quality"]["frame_rate"]
+HEAP_SIZES = (7, 31, 127)
+PQ_SIZES = (4, 8, 16)
+HEAP_CONFIGS: Dict[str, dict] = {
+    "default": {},
+    "coalesce": {"coalesce_heapify": True},
+    "bulk": {"bulk_build": True},
+    "bulk_static": {"bulk_build": True, "animate_build": False},
+    "compact_lod": {"cfg": replace(default_config, layout="compact", lod_depth=4)},
+}
+# Counts must not grow at all; wall time and memory may move by `tolerance`
+EXACT_METRICS = ("plays", "animated_mobjects", "frames")
+NOISY_METRICS = ("wall_time", "peak_memory")
+
+
+@dataclass
+class BenchResult:
+    name: str
+    size: int
+    config: str
+    wall_time: float  # seconds, best of the repeats
+    plays: int
+    animated_mobjects: int
+    peak_memory: int  # bytes
+    frames: int  # at low quality
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.config}, n={self.size}]"
+
+
+@dataclass
+class BenchCase:
+    name: str
+    size: int
+    config: str
+    setup: Callable[[Scene], object]  # builds the state the operation runs on; not measured
+    run: Callable[[Scene, object], None]
+
+
+def _random_values(size: int, seed: int = 122) -> List[int]:
+    rng = random.Random(seed)
+    return [rng.randint(0, 99) for _ in range(size)]
+
+
+def _heap_cases(size: int, config: str, kwargs: dict) -> List[BenchCase]:
+    values = _random_values(size)
+
+    def heap(scene: Scene, n: int = size) -> MinHeap:
+        return MinHeap(values[:n], limit=size + 1, scene=scene, **kwargs)
+
+    return [
+        BenchCase("construct", size, config, lambda scene: None, lambda scene, _: heap(scene)),
+        BenchCase("add_node", size, config, lambda scene: heap(scene, size - 1), lambda scene, h: h.add_node(values[-1], scene)),
+        BenchCase("remove_node", size, config, heap, lambda scene, h: h.remove_node(1, scene)),
+        BenchCase("show_indices", size, config, heap, lambda scene, h: h.show_indices(scene)),
+    ]
+
+
+def _pq_cases(size: int) -> List[BenchCase]:
+    values = _random_values(size)
+    cfg = replace(default_pq_config, capacity=size + 1)
+    return [
+        BenchCase("pq_add", size, "default", lambda scene: PriorityQueue(sorted(values[:-1]), scene, cfg=cfg), lambda scene, pq: pq.pq_add(scene, values[-1])),
+        BenchCase("pq_rem", size, "default", lambda scene: PriorityQueue(sorted(values), scene, cfg=cfg), lambda scene, pq: pq.pq_rem(scene)),
+    ]
+
+
+def default_cases(heap_sizes: Sequence[int] = HEAP_SIZES, pq_sizes: Sequence[int] = PQ_SIZES) -> List[BenchCase]:
+    """Every operation on every heap config and size, then the priority queue operations."""
+    cases = []
+    for size in heap_sizes:
+        for config, kwargs in HEAP_CONFIGS.items():
+            cases += _heap_cases(size, config, kwargs)
+    for size in pq_sizes:
+        cases += _pq_cases(size)
+    return cases
+
+
+def _measure(case: BenchCase, trace_memory: bool):
+    scene = RecordingScene()
+    state = case.setup(scene)
+    scene.calls.clear()
+    gc.collect()
+    if trace_memory: tracemalloc.start()
+    start = time.perf_counter()
+    case.run(scene, state)
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak, scene
+
+
+def run_case(case: BenchCase, repeat: int = 3) -> BenchResult:
+    """Runs the case `repeat` times for wall time (best) and once more under tracemalloc for peak memory."""
+    times = [_measure(case, trace_memory=False)[0] for _ in range(repeat)]
+    _, peak, scene = _measure(case, trace_memory=True)
+    return BenchResult(
+        name=case.name, size=case.size, config=case.config,
+        wall_time=min(times),
+        plays=scene.plays,
+        animated_mobjects=sum(len(call.mobjects) for call in scene.calls_of("play")),
+        peak_memory=peak,
+        # Scene.get_time_progression steps through np.arange(0, run_time, 1 / fps)
+        frames=sum(math.ceil(call.run_time * LOW_QUALITY_FPS) for call in scene.calls if call.kind in ("play", "wait")),
+    )
+
+
+def compare(results: List[BenchResult], baseline: Dict[str, dict], tolerance: float = 0.2) -> List[str]:
+    """Lists every metric that regressed against the baseline."""
+    regressions = []
+    for result in results:
+        before = baseline.get(result.key)
+        if before is None: continue
+        for metric in EXACT_METRICS + NOISY_METRICS:
+            old, new = before[metric], getattr(result, metric)
+            limit = old * (1 + tolerance) if metric in NOISY_METRICS else old
+            if new > limit:
+                regressions.append(f"{result.key} {metric}: {old} -> {new}")
+    return regressions
+
+
+def report(results: List[BenchResult]) -> str:
+    lines = [f"{'Case':<36} {'Time (ms)':>10} {'Plays':>6} {'Mobjects':>9} {'Peak (KiB)':>11} {'Frames':>7}"]
+    for result in results:
+        lines.append(
+            f"{result.key:<36} {result.wall_time * 1e3:>10.2f} {result.plays:>6} {result.animated_mobjects:>9} "
+            f"{result.peak_memory / 1024:>11.1f} {result.frames:>7}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Benchmark MinHeap, HeapArray and PriorityQueue operations without rendering.")
+    parser.add_argument("--filter", help="Only run operations whose name contains this text, e.g. add_node")
+    parser.add_argument("--heap-sizes", type=int, nargs="+", default=list(HEAP_SIZES))
+    parser.add_argument("--pq-sizes", type=int, nargs="+", default=list(PQ_SIZES))
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case; the best is reported (default: 3)")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against; exits with status 1 on regressions")
+    parser.add_argument("--save", help="Write the results as a baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative growth of wall time and memory (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in default_cases(args.heap_sizes, args.pq_sizes)
+             if not args.filter or args.filter in case.name]
+    results = [run_case(case, repeat=args.repeat) for case in cases]
+    print(report(results))
+
+    if args.save:
+        Path(args.save).write_text(json.dumps({result.key: asdict(result) for result in results}, indent=2))
+    if args.baseline:
+        regressions = compare(results, json.loads(Path(args.baseline).read_text()), args.tolerance)
+        print("\n".join(["Regressions:"] + regressions) if regressions else "No regressions.")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,66 +1,96 @@
 from manim import *
-from typing import Union, TYPE_CHECKING, Optional, List
-from dataclasses import dataclass, field
+from typing import Union, TYPE_CHECKING, Optional, List, Dict, Sequence, Iterable
 import numpy as np
+from .label_cache import cached_text
+from .playback import play_changed
+from .instrument import instrumented, count
+from .heap_core import HeapCore, PriorityFn, heapify_order, COMPARE, SWAP, FILL, EMPTY, REPOSITION
+from .configs import BinaryTreeConfig, default_config
 
 # Forward reference for type hinting in Edge class
 if TYPE_CHECKING:
     from __main__ import MinHeap
 
-# Configuration for the visual properties and animation timings of the heap
-@dataclass
-class BinaryTreeConfig:
-    # --- Node Visual Properties ---
-    node_padding: float = 0.15
-    text_color: str = BLACK
-    fill_color: str = WHITE
-    font: str = "JetBrains Mono"
-    node_radius: float = 0.4
-    font_size: float = 24
-
-    # --- Tree Structure Properties ---
-    h_spacing: float = 1.5
-    level_height: float = 1.5
-    edge_color: str = WHITE
-    edge_width: float = 3.0
-    edge_z_index: int = -1
-
-    # --- Highlight Properties ---
-    highlight_stroke_color: str = DARK_BROWN
-    highlight_stroke_width: float = 4.0
-    highlight_fill_color: str = ORANGE
-    highlight_text_color: str = WHITE
-
-    # --- Array Visual Properties ---
-    array_fill_color: str = WHITE
-    array_stroke_color: str = BLACK
-    array_stroke_width: float = 2.0
-    array_text_color: str = BLACK
-    array_font_size: float = 24
-    array_cell_size: float = 0.8
-    array_cell_spacing: float = 0.1
-    array_empty_stroke_color: str = DARK_GRAY
-    array_empty_stroke_dashed: bool = True
-
-    # --- Index Label Properties ---
-    index_text_color: str = ORANGE
-
-    # --- Animation Durations ---
-    initial_create_duration: float = 0.4
-    initial_edge_duration: float = 0.3
-    initial_heapify_swap_duration: float = 0.5
-    initial_reposition_duration: float = 0.7
-    insert_create_duration: float = 0.7
-    insert_edge_duration: float = 0.5
-    insert_heapify_swap_duration: float = 0.7
-    insert_reposition_duration: float = 0.7
-    highlight_duration: float = 0.3
-    remove_swap_duration: float = 0.7
-    remove_fade_duration: float = 0.5
-    label_fade_duration: float = 0.5
-
-
-default_config = BinaryTreeConfig()
+
+class BinaryTreePrototypes:
+    """
+    Node shells and array cell shapes, built once per configuration and handed out as copies.
+
+    Each prototype is keyed by the config fields it depends on, so every BinaryTreeConfig
+    (or an edited one) gets matching geometry without rebuilding it for each node or cell.
+    """
+    _shapes: Dict[tuple, VMobject] = {}
+
+    @classmethod
+    def _copy(cls, key: tuple, build) -> VMobject:
+        shape = cls._shapes.get(key)
+        if shape is None:
+            shape = cls._shapes[key] = build()
+        return shape.copy()
+
+    @classmethod
+    def node_shell(cls, cfg: BinaryTreeConfig) -> Dot:
+        key = ("node", cfg.node_radius, cfg.node_padding, cfg.fill_color, cfg.text_color)
+        return cls._copy(key, lambda: Dot(
+            radius=cfg.node_radius + cfg.node_padding,
+            fill_color=cfg.fill_color,
+            stroke_color=cfg.text_color,
+            stroke_width=2
+        ))
+
+    @classmethod
+    def null_cell(cls, cfg: BinaryTreeConfig) -> Square:
+        key = ("null", cfg.array_cell_size)
+        return cls._copy(key, lambda: Square(side_length=cfg.array_cell_size, color=GRAY, fill_color=BLACK, fill_opacity=0.2))
+
+    @classmethod
+    def empty_cell(cls, cfg: BinaryTreeConfig) -> VMobject:
+        key = ("empty", cfg.array_cell_size, cfg.array_empty_stroke_dashed, cfg.array_empty_stroke_color)
+        def build():
+            cell_shape = Square(side_length=cfg.array_cell_size)
+            if cfg.array_empty_stroke_dashed:
+                cell_shape = DashedVMobject(cell_shape, num_dashes=12, dashed_ratio=0.6)
+            return cell_shape.set_style(stroke_color=cfg.array_empty_stroke_color)
+        return cls._copy(key, build)
+
+    @classmethod
+    def filled_cell(cls, cfg: BinaryTreeConfig) -> Square:
+        key = ("filled", cfg.array_cell_size, cfg.array_fill_color, cfg.array_stroke_color, cfg.array_stroke_width)
+        return cls._copy(key, lambda: Square(side_length=cfg.array_cell_size).set_style(
+            fill_color=cfg.array_fill_color, fill_opacity=1,
+            stroke_color=cfg.array_stroke_color, stroke_width=cfg.array_stroke_width
+        ))
+
+    @classmethod
+    def summary_shell(cls, cfg: BinaryTreeConfig) -> Triangle:
+        key = ("summary", cfg.node_radius, cfg.node_padding, cfg.fill_color, cfg.edge_color)
+        return cls._copy(key, lambda: Triangle().scale_to_fit_width(2 * (cfg.node_radius + cfg.node_padding)).set_style(
+            fill_color=cfg.fill_color, fill_opacity=0.25, stroke_color=cfg.edge_color, stroke_width=2
+        ))
+
+    @classmethod
+    def clear(cls):
+        cls._shapes.clear()
+
+def _method_anim(method, deferred: bool, *args, **kwargs) -> Animation:
+    """
+    Returns `mob.animate.method(*args, **kwargs)`, or with `deferred` an ApplyMethod whose
+    target is only computed when the animation begins (needed inside a Succession, where
+    earlier steps may still move or restyle the mobject).
+    """
+    if deferred:
+        return ApplyMethod(method, *args, kwargs)
+    return getattr(method.__self__.animate, method.__name__)(*args, **kwargs)
+
+
+def _step(anims: Iterable[Optional[Animation]], run_time: float) -> Animation:
+    """
+    One step of a Succession: the animations that are not None or empty groups, played
+    together. AnimationGroup refuses to begin without animations, so when none are left
+    the step is a Wait of the same length and the pacing does not change.
+    """
+    anims = [anim for anim in anims if anim is not None and not (isinstance(anim, AnimationGroup) and not anim.animations)]
+    return AnimationGroup(*anims, run_time=run_time) if anims else Wait(run_time)
 
 class BinaryTreeNode(VGroup):
     """A VGroup representing a single node in the heap."""
@@ -68,173 +98,391 @@ class BinaryTreeNode(VGroup):
         super().__init__()
         self.data = data
         self.cfg = cfg
-        self.label = Text(str(data), color=cfg.text_color, font=cfg.font, font_size=cfg.font_size)
-        temp_node = LabeledDot(self.label, fill_color=cfg.fill_color, radius=cfg.node_radius)
-        self.node_circle = Dot(
-            radius=temp_node[0].get_radius() + cfg.node_padding,
-            fill_color=cfg.fill_color,
-            stroke_color=cfg.text_color,
-            stroke_width=2
-        )
+        self.label = cached_text(data, cfg.font, cfg.font_size, cfg.text_color)
+        self.node_circle = BinaryTreePrototypes.node_shell(cfg)
         self.add(self.node_circle, self.label)
         self.original_stroke_color = self.node_circle.get_stroke_color()
         self.original_stroke_width = self.node_circle.get_stroke_width()
         self.original_fill_color = self.node_circle.get_fill_color()
         self.original_text_color = self.label.get_color()
 
-    def get_highlight_anim(self, stroke_color=None, stroke_width=None, fill_color=None, text_color=None):
+    def get_highlight_anim(self, stroke_color=None, stroke_width=None, fill_color=None, text_color=None, deferred=False):
         sc = stroke_color or self.cfg.highlight_stroke_color
         sw = stroke_width or self.cfg.highlight_stroke_width
         fc = fill_color or self.cfg.highlight_fill_color
         tc = text_color or self.cfg.highlight_text_color
         return AnimationGroup(
-            self.node_circle.animate.set_stroke(color=sc, width=sw),
-            self.node_circle.animate.set_fill(color=fc, opacity=1),
-            self.label.animate.set_color(tc)
+            _method_anim(self.node_circle.set_stroke, deferred, color=sc, width=sw),
+            _method_anim(self.node_circle.set_fill, deferred, color=fc, opacity=1),
+            _method_anim(self.label.set_color, deferred, tc)
         )
 
-    def get_unhighlight_anim(self):
+    def get_unhighlight_anim(self, deferred=False):
         return AnimationGroup(
-            self.node_circle.animate.set_stroke(color=self.original_stroke_color, width=self.original_stroke_width),
-            self.node_circle.animate.set_fill(color=self.original_fill_color, opacity=1),
-            self.label.animate.set_color(self.original_text_color)
+            _method_anim(self.node_circle.set_stroke, deferred, color=self.original_stroke_color, width=self.original_stroke_width),
+            _method_anim(self.node_circle.set_fill, deferred, color=self.original_fill_color, opacity=1),
+            _method_anim(self.label.set_color, deferred, self.original_text_color)
         )
 
     def __repr__(self):
         return f"BinaryTreeNode({self.data})"
 
+class CollapsedNode:
+    """Stands in for a BinaryTreeNode below cfg.lod_depth: it keeps the value but has no mobjects, so no animations."""
+    __slots__ = ("data",)
+
+    def __init__(self, data: int = 0):
+        self.data = data
+
+    def get_highlight_anim(self, *args, **kwargs) -> None:
+        return None
+
+    def get_unhighlight_anim(self, *args, **kwargs) -> None:
+        return None
+
+    def __repr__(self):
+        return f"CollapsedNode({self.data})"
+
+class SubtreeSummary(VGroup):
+    """A glyph drawn in place of a collapsed subtree, labelled with the number of nodes it holds."""
+    def __init__(self, count: int, cfg: BinaryTreeConfig = default_config):
+        super().__init__()
+        self.count = count
+        self.shape = BinaryTreePrototypes.summary_shell(cfg)
+        self.label = cached_text(count, cfg.font, cfg.font_size * 0.6, cfg.edge_color).move_to(self.shape.get_center() + DOWN * 0.05)
+        if self.label.width > self.shape.width * 0.6:
+            self.label.scale_to_fit_width(self.shape.width * 0.6)
+        self.add(self.shape, self.label)
+
+    def __repr__(self):
+        return f"SubtreeSummary({self.count})"
+
 class Edge(Line):
     """A styled line that connects two structural positions in the heap."""
     def __init__(self, heap: "MinHeap", child_idx: int, cfg: BinaryTreeConfig = default_config):
-        parent_idx = child_idx // 2
-        start_pos = heap._get_pos(parent_idx)
-        end_pos = heap._get_pos(child_idx)
+        if not (2 <= child_idx <= heap.limit): raise IndexError("Node index out of range.")
+        positions = heap._get_positions()
+        start_pos = positions[child_idx // 2]
+        end_pos = positions[child_idx]
         super().__init__(start=start_pos, end=end_pos, color=cfg.edge_color, stroke_width=cfg.edge_width, z_index=cfg.edge_z_index)
 
+class _CellView:
+    """List-style access to a HeapArray's cells by slot index; slots outside the window raise an IndexError."""
+    def __init__(self, array: "HeapArray"):
+        self.array = array
+
+    def __len__(self) -> int:
+        return self.array.heap.limit + 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0: index += len(self)
+        cell_group = self.array.visible_cells.get(index)
+        if cell_group is None:
+            if not (0 <= index < len(self)): raise IndexError(f"Array index {index} out of range.")
+            lo = self.array.window_start
+            raise IndexError(f"Array slot {index} is outside the visible window {lo}..{lo + self.array.window_size - 1}.")
+        return cell_group
+
+    def __iter__(self):
+        """The visible cells in slot order; every cell when there is no window."""
+        return iter([self.array.visible_cells[i] for i in sorted(self.array.visible_cells)])
+
 class HeapArray(VGroup):
-    """A VGroup representing the heap's underlying array, pre-sized to the limit."""
+    """
+    A VGroup representing the heap's underlying array, pre-sized to the limit.
+
+    With cfg.array_window set, only that many consecutive slots get cell mobjects. Hidden
+    slots on either side are summarized by an ellipsis, and the window slides (fading the
+    old cells out and the new ones in) whenever fill/empty/swap touch an index outside it.
+    """
     def __init__(self, heap: "MinHeap", position: np.ndarray = DOWN * 2, cfg: BinaryTreeConfig = default_config):
         super().__init__()
         self.heap = heap
         self.cfg = cfg
-        # Structure of each item in self.cells: VGroup(cell_shape, index_label, data_label)
-        self.cells: List[VGroup] = []
+        # Structure of each item in self.visible_cells: VGroup(cell_shape, index_label, data_label), keyed by
+        # array index. Only the slots inside the window have cells; self.cells indexes them like a list.
+        self.visible_cells: Dict[int, VGroup] = {}
+        # Values held by every filled slot, including the ones outside the window
+        self.values: Dict[int, int] = {}
         # Store original colors for unhighlighting
         self.original_cell_styles = {}
 
-        for i in range(self.heap.limit + 1):
-            cell_group = self._create_null_cell() if i == 0 else self._create_empty_cell(i)
-            self.cells.append(cell_group)
+        num_slots = self.heap.limit + 1
+        self.window_size = num_slots if cfg.array_window is None else max(1, min(cfg.array_window, num_slots))
+        self.window_start = 0
+        self.ellipses = VGroup()
 
-        self.add(*self.cells)
+        for i in range(self.window_size):
+            self.visible_cells[i] = self._create_null_cell() if i == 0 else self._create_empty_cell(i)
+
+        self.add(*self.visible_cells.values())
         self._arrange_cells()
         self.move_to(position)
 
+    @property
+    def cells(self) -> _CellView:
+        return _CellView(self)
+
     def _get_cell_pos(self, i: int) -> np.ndarray:
-        return RIGHT * (i * (self.cfg.array_cell_size + self.cfg.array_cell_spacing))
+        return RIGHT * ((i - self.window_start) * (self.cfg.array_cell_size + self.cfg.array_cell_spacing))
 
     def _arrange_cells(self):
-        for i, cell_group in enumerate(self.cells):
+        for i, cell_group in self.visible_cells.items():
             cell_group.move_to(self._get_cell_pos(i))
+        self._set_ellipses(ORIGIN)
+        self.add(self.ellipses)
         self.center()
 
+    def _in_range(self, index: int) -> bool:
+        return 1 <= index <= self.heap.limit
+
     def _create_null_cell(self) -> VGroup:
-        cell = Square(side_length=self.cfg.array_cell_size, color=GRAY, fill_color=BLACK, fill_opacity=0.2)
-        index = Text("0", font=self.cfg.font, font_size=self.cfg.array_font_size * 0.5, color=GRAY).next_to(cell, DOWN, buff=0.15)
+        cell = BinaryTreePrototypes.null_cell(self.cfg)
+        index = cached_text(0, self.cfg.font, self.cfg.array_font_size * 0.5, GRAY).next_to(cell, DOWN, buff=0.15)
         label = VGroup()
         return VGroup(cell, index, label)
 
     def _create_empty_cell(self, index: int) -> VGroup:
-        cell_shape = Square(side_length=self.cfg.array_cell_size)
-        if self.cfg.array_empty_stroke_dashed:
-            cell_shape = DashedVMobject(cell_shape, num_dashes=12, dashed_ratio=0.6)
-        cell_shape.set_style(stroke_color=self.cfg.array_empty_stroke_color)
-        index_label = Text(str(index), font=self.cfg.font, font_size=self.cfg.array_font_size * 0.5, color=GRAY).next_to(cell_shape, DOWN, buff=0.15)
+        cell_shape = BinaryTreePrototypes.empty_cell(self.cfg)
+        index_label = cached_text(index, self.cfg.font, self.cfg.array_font_size * 0.5, GRAY).next_to(cell_shape, DOWN, buff=0.15)
         data_label = VGroup()
         return VGroup(cell_shape, index_label, data_label).move_to(self._get_cell_pos(index))
 
-    def fill_cell_animated(self, index: int, value: int):
-        if not (1 <= index < len(self.cells)): return AnimationGroup()
-        cell_group = self.cells[index]
-        old_shape = cell_group[0]
-        new_shape = Square(side_length=self.cfg.array_cell_size).set_style(
-            fill_color=self.cfg.array_fill_color, fill_opacity=1,
-            stroke_color=self.cfg.array_stroke_color, stroke_width=self.cfg.array_stroke_width
-        ).move_to(old_shape.get_center())
-        new_label = Text(str(value), font=self.cfg.font, font_size=self.cfg.array_font_size, color=self.cfg.array_text_color).move_to(new_shape.get_center())
-        new_label.set_z_index(new_shape.z_index + 1)
+    def _create_filled_shape(self) -> Square:
+        return BinaryTreePrototypes.filled_cell(self.cfg)
+
+    def _create_data_label(self, value: int, shape: VMobject) -> Text:
+        label = cached_text(value, self.cfg.font, self.cfg.array_font_size, self.cfg.array_text_color).move_to(shape.get_center())
+        label.set_z_index(shape.z_index + 1)
+        return label
+
+    def _remember_style(self, index: int, shape: VMobject, label: Text):
         self.original_cell_styles[index] = {
-            "fill_color": new_shape.get_fill_color(), "stroke_color": new_shape.get_stroke_color(),
-            "stroke_width": new_shape.get_stroke_width(), "text_color": new_label.get_color()
+            "fill_color": shape.get_fill_color(), "stroke_color": shape.get_stroke_color(),
+            "stroke_width": shape.get_stroke_width(), "text_color": label.get_color()
         }
+
+    def _create_ellipsis(self, first: int, last: int) -> VGroup:
+        """A placeholder slot summarizing the hidden indices first..last."""
+        frame = Square(side_length=self.cfg.array_cell_size, stroke_opacity=0)
+        dots = cached_text("...", self.cfg.font, self.cfg.array_font_size, GRAY).move_to(frame)
+        span = f"{first}-{last}" if first != last else first
+        span_label = cached_text(span, self.cfg.font, self.cfg.array_font_size * 0.5, GRAY).next_to(frame, DOWN, buff=0.15)
+        return VGroup(frame, dots, span_label)
+
+    def _set_ellipses(self, origin: np.ndarray):
+        """Rebuilds the ellipses around the window, `origin` being the position of the first visible slot."""
+        step = self.cfg.array_cell_size + self.cfg.array_cell_spacing
+        last_visible = self.window_start + self.window_size - 1
+        ellipses = []
+        if self.window_start > 0:
+            ellipses.append(self._create_ellipsis(0, self.window_start - 1).move_to(origin + LEFT * step))
+        if last_visible < self.heap.limit:
+            ellipses.append(self._create_ellipsis(last_visible + 1, self.heap.limit).move_to(origin + RIGHT * step * self.window_size))
+        self.ellipses.remove(*self.ellipses)
+        self.ellipses.add(*ellipses)
+
+    # --- Windowing ---
+    def in_window(self, *indices: int) -> bool:
+        lo = self.window_start
+        return all(lo <= i < lo + self.window_size for i in indices)
+
+    def _ensure_visible(self, *indices: int) -> list:
+        """Slides the window so that `indices` (or at least the first one) are visible. Returns the animations for the move."""
+        if self.in_window(*indices):
+            return []
+        lo, size = self.window_start, self.window_size
+        first, last = min(indices), max(indices)
+        if last - first < size:
+            new_start = first if first < lo else last - size + 1
+        else:
+            new_start = indices[0] - size // 2
+        new_start = max(0, min(new_start, self.heap.limit + 1 - size))
+        return self._move_window(new_start) if new_start != lo else []
+
+    def _move_window(self, new_start: int) -> list:
+        step = self.cfg.array_cell_size + self.cfg.array_cell_spacing
+        origin = self.visible_cells[self.window_start].get_center()
+        old_mobjects = [*self.visible_cells.values(), *self.ellipses]
+        self.remove(*self.visible_cells.values())
+        self.visible_cells.clear()
+        self.original_cell_styles.clear()
+
+        self.window_start = new_start
+        for i in range(new_start, new_start + self.window_size):
+            if i == 0:
+                cell_group = self._create_null_cell()
+            elif i in self.values:
+                shape = self._create_filled_shape()
+                label = self._create_data_label(self.values[i], shape)
+                index_label = cached_text(i, self.cfg.font, self.cfg.array_font_size * 0.5, GRAY).next_to(shape, DOWN, buff=0.15)
+                cell_group = VGroup(shape, index_label, label)
+                self._remember_style(i, shape, label)
+            else:
+                cell_group = self._create_empty_cell(i)
+            self.visible_cells[i] = cell_group.move_to(origin + RIGHT * step * (i - new_start))
+        self._set_ellipses(origin)
+        self.add(*self.visible_cells.values())
+        return [*[FadeOut(mob) for mob in old_mobjects], *[FadeIn(mob) for mob in [*self.visible_cells.values(), *self.ellipses]]]
+
+    def _after_window_move(self, window_anims: list, anim: Optional[Animation]) -> Optional[Animation]:
+        if not window_anims: return anim
+        return Succession(AnimationGroup(*window_anims), anim) if anim is not None else AnimationGroup(*window_anims)
+
+    # --- Cell operations ---
+    def _fill_visible(self, index: int, value: int, animate: bool = True) -> Optional[Animation]:
+        cell_group = self.visible_cells[index]
+        old_shape = cell_group[0]
+        new_shape = self._create_filled_shape().move_to(old_shape.get_center())
+        new_label = self._create_data_label(value, new_shape)
+        self._remember_style(index, new_shape, new_label)
         cell_group[0] = new_shape
         cell_group[2] = new_label
-        return AnimationGroup(FadeTransform(old_shape, new_shape), Create(new_label))
+        return AnimationGroup(FadeTransform(old_shape, new_shape), Create(new_label)) if animate else None
+
+    def fill_cell_animated(self, index: int, value: int):
+        if not self._in_range(index): return None
+        window_anims = self._ensure_visible(index)
+        self.values[index] = value
+        return self._after_window_move(window_anims, self._fill_visible(index, value))
+
+    def fill_cells(self, values: Sequence[int], animate: bool = True) -> list:
+        """
+        Fills slots 1..len(values) at once without moving the window: slots outside it only
+        record their value. Returns the fill animations of the visible cells, or [] when not animating.
+        """
+        if len(values) > self.heap.limit: raise ValueError("Heap limit exceeded.")
+        anims = []
+        for i, value in enumerate(values, start=1):
+            self.values[i] = value
+            if i in self.visible_cells:
+                anim = self._fill_visible(i, value, animate)
+                if animate: anims.append(anim)
+        return anims
 
     def empty_cell_animated(self, index: int):
-        if not (1 <= index < len(self.cells)): return AnimationGroup()
-        cell_group = self.cells[index]
+        if not self._in_range(index): return None
+        window_anims = self._ensure_visible(index)
+        self.values.pop(index, None)
+        cell_group = self.visible_cells[index]
         old_shape, old_label = cell_group[0], cell_group[2]
         new_group = self._create_empty_cell(index).move_to(cell_group.get_center())
-        self.cells[index] = new_group
+        self.visible_cells[index] = new_group
         self.original_cell_styles.pop(index, None)
-        return AnimationGroup(FadeTransform(old_shape, new_group[0]), FadeOut(old_label))
-
-    def swap_cells_animated(self, idx1: int, idx2: int):
-        if not (1 <= idx1 < len(self.cells) and 1 <= idx2 < len(self.cells)): return AnimationGroup()
-        cell1_group, cell2_group = self.cells[idx1], self.cells[idx2]
-        if len(cell1_group) < 3 or len(cell2_group) < 3: return AnimationGroup()
-        label1, label2 = cell1_group[2], cell2_group[2]
-        swap_animation = AnimationGroup(
-            label1.animate.move_to(cell2_group[0].get_center()),
-            label2.animate.move_to(cell1_group[0].get_center())
-        )
-        cell1_group[2], cell2_group[2] = cell2_group[2], cell1_group[2]
-        return swap_animation
-
-    def highlight_cell_animated(self, index: int, **kwargs):
-        if not (1 <= index < len(self.cells)) or index not in self.original_cell_styles: return AnimationGroup()
-        cell_group = self.cells[index]
+        return self._after_window_move(window_anims, AnimationGroup(FadeTransform(old_shape, new_group[0]), FadeOut(old_label)))
+
+    def swap_cells_animated(self, idx1: int, idx2: int, deferred: bool = False, move_window: bool = True):
+        """
+        Swaps the values of two slots. With move_window False the window stays put and only the
+        cells already in it are animated. Returns None when no cell changes on screen.
+        """
+        if not (self._in_range(idx1) and self._in_range(idx2)): return None
+        window_anims = self._ensure_visible(idx1, idx2) if move_window else []
+        if idx1 in self.values and idx2 in self.values:
+            self.values[idx1], self.values[idx2] = self.values[idx2], self.values[idx1]
+
+        swap_animation = None
+        visible = [i for i in (idx1, idx2) if i in self.visible_cells]
+        if len(visible) == 2:
+            cell1_group, cell2_group = self.visible_cells[idx1], self.visible_cells[idx2]
+            if len(cell1_group) == 3 and len(cell2_group) == 3:
+                label1, label2 = cell1_group[2], cell2_group[2]
+                swap_animation = AnimationGroup(
+                    _method_anim(label1.move_to, deferred, cell2_group[0].get_center()),
+                    _method_anim(label2.move_to, deferred, cell1_group[0].get_center())
+                )
+                cell1_group[2], cell2_group[2] = cell2_group[2], cell1_group[2]
+        elif visible and visible[0] in self.values:
+            # Only one side is in the window: its label is replaced by the value coming from off-screen
+            cell_group = self.visible_cells[visible[0]]
+            new_label = self._create_data_label(self.values[visible[0]], cell_group[0])
+            swap_animation = FadeTransform(cell_group[2], new_label)
+            cell_group[2] = new_label
+        return self._after_window_move(window_anims, swap_animation)
+
+    def highlight_cell_animated(self, index: int, deferred: bool = False, **kwargs):
+        if index not in self.visible_cells or index not in self.original_cell_styles: return None
+        cell_group = self.visible_cells[index]
         cell_shape, cell_label = cell_group[0], cell_group[2]
         sc = kwargs.get("stroke_color", self.cfg.highlight_stroke_color)
         sw = kwargs.get("stroke_width", self.cfg.highlight_stroke_width)
         fc = kwargs.get("fill_color", self.cfg.highlight_fill_color)
         tc = kwargs.get("text_color", self.cfg.highlight_text_color)
         return AnimationGroup(
-            cell_shape.animate.set_stroke(color=sc, width=sw),
-            cell_shape.animate.set_fill(color=fc, opacity=1),
-            cell_label.animate.set_color(tc)
+            _method_anim(cell_shape.set_stroke, deferred, color=sc, width=sw),
+            _method_anim(cell_shape.set_fill, deferred, color=fc, opacity=1),
+            _method_anim(cell_label.set_color, deferred, tc)
         )
 
-    def unhighlight_cell_animated(self, index: int):
-        if not (1 <= index < len(self.cells)) or index not in self.original_cell_styles: return AnimationGroup()
-        cell_group = self.cells[index]
+    def unhighlight_cell_animated(self, index: int, deferred: bool = False):
+        if index not in self.visible_cells or index not in self.original_cell_styles: return None
+        cell_group = self.visible_cells[index]
         cell_shape, cell_label = cell_group[0], cell_group[2]
         original = self.original_cell_styles[index]
         return AnimationGroup(
-            cell_shape.animate.set_stroke(color=original["stroke_color"], width=original["stroke_width"]),
-            cell_shape.animate.set_fill(color=original["fill_color"], opacity=1),
-            cell_label.animate.set_color(original["text_color"])
+            _method_anim(cell_shape.set_stroke, deferred, color=original["stroke_color"], width=original["stroke_width"]),
+            _method_anim(cell_shape.set_fill, deferred, color=original["fill_color"], opacity=1),
+            _method_anim(cell_label.set_color, deferred, original["text_color"])
         )
 
 class MinHeap(VGroup):
-    """A VGroup that manages and animates a Min-Heap data structure."""
-    def __init__(self, data: Union[list[int], None] = None, limit: int = 15, root_pos: np.ndarray = UP * 3, array_pos: np.ndarray = DOWN*2.5, cfg: BinaryTreeConfig = default_config, scene: Scene = None):
+    """
+    A VGroup that manages and animates a Min-Heap data structure.
+
+    With coalesce_heapify, every sift-up/sift-down path is played as a single Succession
+    instead of one scene.play per highlight, unhighlight and swap.
+
+    With bulk_build, the initial data is heapified bottom-up (Floyd) in O(n): all nodes,
+    cells and edges are created in one play and the sift-downs are played one tree level
+    at a time, or not animated at all when animate_build is False.
+
+    For deep heaps, cfg.layout = "compact" fits the tree into cfg.layout_width, and
+    cfg.lod_depth keeps only the levels above that depth as nodes: every subtree rooted
+    at that depth is drawn as a single SubtreeSummary holding CollapsedNodes. Together with
+    cfg.array_window this bounds the mobject count however large the heap grows.
+
+    Keys live in a NumPy array parallel to `nodes`, so sift decisions never touch the
+    mobjects. `has_higher_priority(a, b)` (default `<`) orders generic elements; with the
+    default and numeric keys, multi-way comparisons and bulk builds are vectorized.
+
+    With debug, check_invariants() runs after construction and after every add_node and
+    remove_node, raising an AssertionError as soon as the heap and its mobjects disagree.
+    """
+    def __init__(self, data: Union[list[int], None] = None, limit: int = 15, root_pos: np.ndarray = UP * 3, array_pos: np.ndarray = DOWN*2.5, cfg: BinaryTreeConfig = default_config, scene: Scene = None, coalesce_heapify: bool = False, bulk_build: bool = False, animate_build: bool = True, has_higher_priority: Optional[PriorityFn] = None, debug: bool = False):
         super().__init__()
+        self.debug = debug
+        self.has_higher_priority = has_higher_priority
+        # keys[i] is nodes[i].data; integer until a value needs a wider (float or object) dtype
+        self.keys = np.zeros(limit + 1, dtype=np.int64 if has_higher_priority is None else object)
+        self.coalesce_heapify = coalesce_heapify
         if data is None: data = []
         self.nodes: List[Optional[BinaryTreeNode]] = [None]
         self.edges = VGroup()
+        # Edge into each child slot, so adding/removing the last slot's edge is O(1)
+        self.edge_by_child: Dict[int, Edge] = {}
+        self._edges_layout_key = None
         self.index_labels = VGroup() # To hold the index labels
         self.limit = limit
         self.len = 0
         self.max_levels = int(np.floor(np.log2(limit))) + 1 if limit > 0 else 0
         self.root_pos = root_pos
         self.cfg = cfg
+        if cfg.layout not in ("classic", "compact"): raise ValueError(f"Unknown tree layout: {cfg.layout!r}")
+        if cfg.lod_depth is not None and cfg.lod_depth < 1: raise ValueError("lod_depth must be at least 1.")
+        self._positions = None
+        self._positions_key = None
+        # Glyph for each collapsed subtree, keyed by the index of its root
+        self.summaries: Dict[int, SubtreeSummary] = {}
         self.array_vis = HeapArray(self, position=array_pos, cfg=cfg)
         self.add(self.edges, self.array_vis, self.index_labels)
 
 
-        if scene:
+        if bulk_build:
+            if scene: scene.add(self)
+            self._bulk_build(data, scene, animate=animate_build)
+        elif scene:
             scene.add(self)
             for value in data:
                 self._add_and_heapify_animated(scene, value, is_initial_build=True)
@@ -243,58 +491,279 @@ class MinHeap(VGroup):
             for value in data:
                 self._add_node_internal(value)
                 self._heapify_up_internal()
+            self.array_vis.fill_cells([self.nodes[i].data for i in range(1, self.len + 1)], animate=False)
             self._reposition_all_nodes_internal()
+        if self.debug: self.check_invariants()
 
     def _get_pos(self, index: int) -> np.ndarray:
         if not (1 <= index <= self.limit): raise IndexError("Node index out of range.")
-        level = int(np.floor(np.log2(index)))
-        y_pos = self.root_pos[1] - level * self.cfg.level_height
-        index_in_level = index - 2**level
-        spacing_at_level = self.cfg.h_spacing * (2**(self.max_levels - 1 - level))
-        num_slots_in_level = 2**level
-        x_pos = self.root_pos[0] + (index_in_level - (num_slots_in_level - 1) / 2) * spacing_at_level
-        return np.array([x_pos, y_pos, 0])
+        return self._get_positions()[index].copy()
+
+    def _get_positions(self) -> np.ndarray:
+        """
+        Returns the (limit + 1) x 3 table of structural positions (row 0 unused), recomputed
+        only when root_pos, limit or the spacing config changed since the last call.
+        Treat it as read-only.
+        """
+        cfg = self.cfg
+        key = (float(self.root_pos[0]), float(self.root_pos[1]), self.limit, cfg.h_spacing, cfg.level_height,
+               cfg.layout, cfg.layout_width, cfg.layout_height, cfg.lod_depth)
+        if key != self._positions_key:
+            self._positions = self._compute_positions()
+            self._positions_key = key
+        return self._positions
+
+    def _compute_positions(self) -> np.ndarray:
+        self.max_levels = int(self.limit).bit_length() if self.limit > 0 else 0
+        indices = np.arange(1, self.limit + 1)
+        # frexp gives index = m * 2**e with 0.5 <= m < 1, so e - 1 is the exact level
+        level = np.frexp(indices)[1] - 1
+        num_slots_in_level = np.exp2(level)
+        index_in_level = indices - num_slots_in_level
+        # Spacing between the root's two children; every level below halves it
+        root_spacing = self.cfg.h_spacing * 2.0 ** (self.max_levels - 1)
+        level_height = self.cfg.level_height
+        if self.cfg.layout == "compact":
+            root_spacing = min(root_spacing, self.cfg.layout_width)
+            shown_levels = self.max_levels if self.cfg.lod_depth is None else min(self.max_levels, self.cfg.lod_depth + 1)
+            if self.cfg.layout_height is not None and shown_levels > 1:
+                level_height = min(level_height, self.cfg.layout_height / (shown_levels - 1))
+        spacing_at_level = root_spacing / num_slots_in_level
+        positions = np.zeros((self.limit + 1, 3))
+        positions[1:, 0] = self.root_pos[0] + (index_in_level - (num_slots_in_level - 1) / 2) * spacing_at_level
+        positions[1:, 1] = self.root_pos[1] - level * level_height
+        return positions
+
+    # --- Keys ---
+    def _set_key(self, index: int, value):
+        dtype = np.asarray(value).dtype
+        if self.keys.dtype != object:
+            wider = np.promote_types(self.keys.dtype, dtype) if dtype.kind in "biuf" else np.dtype(object)
+            if wider != self.keys.dtype: self.keys = self.keys.astype(wider)
+        self.keys[index] = value
+
+    def _swap_keys(self, idx1: int, idx2: int):
+        count("swaps")
+        keys = self.keys
+        keys[idx1], keys[idx2] = keys[idx2], keys[idx1]
+
+    def _numeric_keys(self) -> bool:
+        return self.has_higher_priority is None and self.keys.dtype != object
+
+    def _higher(self, idx1: int, idx2: int) -> bool:
+        """Whether the key at idx1 belongs above the key at idx2."""
+        count("compares")
+        if self.has_higher_priority is None: return bool(self.keys[idx1] < self.keys[idx2])
+        return self.has_higher_priority(self.keys[idx1], self.keys[idx2])
+
+    def _best_of(self, indices: Sequence[int]) -> int:
+        """The index holding the highest-priority key; earlier indices win ties."""
+        if self._numeric_keys():
+            count("compares", len(indices) - 1)
+            return indices[int(np.argmin(self.keys[list(indices)]))]
+        best = indices[0]
+        for i in indices[1:]:
+            if self._higher(i, best): best = i
+        return best
+
+    # --- Level of detail ---
+    def _is_collapsed(self, index: int) -> bool:
+        return self.cfg.lod_depth is not None and index.bit_length() - 1 >= self.cfg.lod_depth
+
+    def _visible_len(self) -> int:
+        """Number of leading slots that are drawn as nodes."""
+        if self.cfg.lod_depth is None: return self.len
+        return min(self.len, 2**self.cfg.lod_depth - 1)
+
+    def _edge_len(self) -> int:
+        """Last child slot with an edge: edges run into visible nodes and into the roots of collapsed subtrees."""
+        if self.cfg.lod_depth is None: return self.len
+        return min(self.len, 2**(self.cfg.lod_depth + 1) - 1)
+
+    def _summary_root(self, index: int) -> int:
+        return index >> (index.bit_length() - 1 - self.cfg.lod_depth)
+
+    def _subtree_size(self, root: int) -> int:
+        size, first, width = 0, root, 1
+        while first <= self.len:
+            size += min(width, self.len - first + 1)
+            first, width = first * 2, width * 2
+        return size
+
+    def _update_summary(self, root: int) -> Optional[Animation]:
+        """Brings the glyph of the subtree at `root` in line with its size. Returns the animation for the change, if any."""
+        size = self._subtree_size(root)
+        old = self.summaries.pop(root, None)
+        if old is not None and old.count == size:
+            self.summaries[root] = old
+            return None
+        if old is not None:
+            self.remove(old)
+        if size == 0:
+            return FadeOut(old)
+        new = SubtreeSummary(size, self.cfg).move_to(self._get_positions()[root])
+        self.summaries[root] = new
+        self.add(new)
+        return FadeIn(new) if old is None else FadeTransform(old, new)
+
+    def _sync_summaries(self) -> list:
+        """Updates every glyph without animating; returns the animations that would introduce the changes."""
+        if self.cfg.lod_depth is None: return []
+        first_root = 2**self.cfg.lod_depth
+        roots = set(range(first_root, min(self.len, 2 * first_root - 1) + 1)) | set(self.summaries)
+        anims = [self._update_summary(root) for root in sorted(roots)]
+        positions = self._get_positions()
+        for root, summary in self.summaries.items():
+            summary.move_to(positions[root])
+        return [anim for anim in anims if anim is not None]
 
     def _add_node_internal(self, value: int) -> BinaryTreeNode:
         self.len += 1
         if self.len > self.limit: raise ValueError("Heap limit exceeded.")
-        node = BinaryTreeNode(value, cfg=self.cfg)
+        self._set_key(self.len, value)
+        if self._is_collapsed(self.len):
+            node = CollapsedNode(value)
+        else:
+            node = BinaryTreeNode(value, cfg=self.cfg).move_to(self._get_pos(self.len))
+            self.add(node)
         self.nodes.append(node)
-        self.add(node)
         return node
 
     def _add_and_heapify_animated(self, scene: Scene, value: int, is_initial_build: bool, is_slide : bool = False):
         create_dur = self.cfg.initial_create_duration if is_initial_build else self.cfg.insert_create_duration
         edge_dur = self.cfg.initial_edge_duration if is_initial_build else self.cfg.insert_edge_duration
         swap_dur = self.cfg.initial_heapify_swap_duration if is_initial_build else self.cfg.insert_heapify_swap_duration
-        new_node = self._add_node_internal(value)
-        new_node.move_to(self._get_pos(self.len))
-        array_fill_anim = self.array_vis.fill_cell_animated(self.len, value)
-        scene.play(Create(new_node), array_fill_anim, run_time=create_dur)
-        if self.len > 1:
-            edge = Edge(self, self.len, self.cfg)
-            self.edges.add(edge)
-            scene.play(Create(edge), run_time=edge_dur)
+        self._append_node_animated(scene, value, create_duration=create_dur, edge_duration=edge_dur)
         if (is_slide):
           scene.next_slide()
         self._heapify_up(scene, self.len, swap_duration=swap_dur)
 
+    def _append_node_animated(self, scene: Scene, value: int, create_duration: float, edge_duration: float):
+        """Creates a node, its array cell and its parent edge in the first open slot."""
+        new_node = self._add_node_internal(value)
+        array_fill_anim = self.array_vis.fill_cell_animated(self.len, value)
+        if isinstance(new_node, CollapsedNode):
+            appear_anim = self._update_summary(self._summary_root(self.len))
+        else:
+            appear_anim = Create(new_node)
+        play_changed(scene, appear_anim, array_fill_anim, run_time=create_duration)
+        if self.len > 1 and not self._is_collapsed(self.len // 2):
+            edge = self._add_edge(self.len)
+            scene.play(Create(edge), run_time=edge_duration)
+
+    def _add_edge(self, child_idx: int) -> Edge:
+        edge = Edge(self, child_idx, self.cfg)
+        if not self.edge_by_child:
+            self._edges_layout_key = self._positions_key
+        self.edge_by_child[child_idx] = edge
+        self.edges.add(edge)
+        return edge
+
+    def _pop_edge(self, child_idx: int) -> Optional[Edge]:
+        edge = self.edge_by_child.pop(child_idx, None)
+        if edge is not None:
+            self.edges.remove(edge)
+        return edge
+
     def _heapify_up_internal(self):
         idx = self.len
-        while idx > 1 and self.nodes[idx].data < self.nodes[idx // 2].data:
+        while idx > 1 and self._higher(idx, idx // 2):
             p_idx = idx // 2
-            self.nodes[idx], self.nodes[p_idx] = self.nodes[p_idx], self.nodes[idx]
+            self._swap_keys(idx, p_idx)
+            if self._is_collapsed(idx) and not self._is_collapsed(p_idx):
+                self._swap_across_lod(idx, p_idx)
+            else:
+                self.nodes[idx], self.nodes[p_idx] = self.nodes[p_idx], self.nodes[idx]
             idx = p_idx
 
-    def _reposition_all_nodes_internal(self):
-        for i in range(1, self.len + 1): self.nodes[i].move_to(self._get_pos(i))
-        self.edges.remove(*self.edges)
-        for i in range(2, self.len + 1): self.edges.add(Edge(self, i, self.cfg))
+    def _bulk_build(self, data: list, scene: Optional[Scene], animate: bool):
+        """Builds the heap from `data` with bottom-up heapify, creating every node, cell and edge in one batch."""
+        if len(data) > self.limit: raise ValueError("Heap limit exceeded.")
+        animate = animate and scene is not None
+        core = HeapCore(limit=self.limit, record=animate, has_higher_priority=self.has_higher_priority)
+        for i, value in enumerate(data, start=1):
+            self._set_key(i, value)
+        if animate:
+            # Nodes start in input order and are sifted down on screen
+            core.keys = [None] + list(data)
+            values = core.keys[1:]
+        elif self._numeric_keys():
+            values = [data[i - 1] for i in heapify_order(self.keys[:len(data) + 1])[1:]]
+        else:
+            core.heapify(data)
+            values = core.keys[1:]
+
+        for value in values:
+            self._add_node_internal(value)
+        fill_anims = self.array_vis.fill_cells(values, animate=animate)
+        for i in range(2, self._edge_len() + 1):
+            self._add_edge(i)
+        summary_anims = self._sync_summaries()
+        if not animate:
+            return
+
+        scene.play(
+            *[Create(node) for node in self.nodes[1:self._visible_len() + 1]],
+            *summary_anims,
+            *fill_anims,
+            *[Create(edge) for edge in self.edges],
+            run_time=self.cfg.initial_create_duration
+        )
 
+        last_parent = self.len // 2
+        for level in range(last_parent.bit_length() - 1, -1, -1):
+            # Sift-downs started on the same level touch disjoint subtrees, so their
+            # k-th swaps can all play together
+            rounds, sifted = [], []
+            for i in range(2**level, min(2**(level + 1), last_parent + 1)):
+                start = len(core.trace)
+                core.sift_down(i)
+                swaps = [event for event in core.trace[start:] if event[0] == SWAP]
+                if swaps: sifted.append(self.nodes[i])
+                for depth, event in enumerate(swaps):
+                    if depth == len(rounds): rounds.append([])
+                    rounds[depth].append(event)
+            if not rounds:
+                continue
+
+            steps = [_step([node.get_highlight_anim(deferred=True) for node in sifted], self.cfg.highlight_duration)]
+            for swaps in rounds:
+                anims = []
+                for _, idx1, idx2 in swaps:
+                    # A round swaps all over the array, so the window stays where it is
+                    anims.extend(self._swap_anims(idx1, idx2, deferred=True, move_window=False))
+                steps.append(_step(anims, self.cfg.initial_heapify_swap_duration))
+            steps.append(_step([node.get_unhighlight_anim(deferred=True) for node in sifted], self.cfg.highlight_duration))
+            scene.play(Succession(*steps))
+
+    def _reposition_all_nodes_internal(self):
+        positions = self._get_positions()
+        for i in range(1, self._visible_len() + 1): self.nodes[i].move_to(positions[i])
+        self._sync_summaries()
+        self._sync_edges()
+
+    def _sync_edges(self):
+        """Adds missing edges for slots 2.._edge_len() and drops extra ones; existing edges are only re-placed if the layout changed."""
+        edge_len = self._edge_len()
+        for child_idx in [i for i in self.edge_by_child if i > edge_len]:
+            self._pop_edge(child_idx)
+        positions = self._get_positions()
+        layout_changed = self._edges_layout_key != self._positions_key
+        for i in range(2, edge_len + 1):
+            edge = self.edge_by_child.get(i)
+            if edge is None:
+                self._add_edge(i)
+            elif layout_changed:
+                edge.put_start_and_end_on(positions[i // 2], positions[i])
+        self._edges_layout_key = self._positions_key
+
+    @instrumented("MinHeap.add_node")
     def add_node(self, value: int, scene: Scene, is_slide = False):
         self._add_and_heapify_animated(scene, value, is_initial_build=False, is_slide=is_slide)
         self._reposition_all_nodes(scene, duration=self.cfg.insert_reposition_duration)
+        if self.debug: self.check_invariants()
 
+    @instrumented("MinHeap.remove_node")
     def remove_node(self, index: int, scene: Scene, is_slide = False):
         """Removes a node at a specific index from the heap."""
         if not (1 <= index <= self.len):
@@ -310,145 +779,173 @@ class MinHeap(VGroup):
         if idx_to_remove != last_idx:
             self.swap_nodes(scene, idx_to_remove, last_idx, duration=self.cfg.remove_swap_duration)
 
-        node_to_remove = self.nodes.pop(last_idx)
-        self.len -= 1
-
-        anims = [FadeOut(node_to_remove), self.array_vis.empty_cell_animated(last_idx)]
-
-
-        if self.len > 0:
-            edge_to_remove = None
-            for edge in self.edges:
-                end_pos = self._get_pos(last_idx)
-                if np.allclose(edge.get_end(), end_pos):
-                    edge_to_remove = edge
-                    break
-            if edge_to_remove:
-                self.edges.remove(edge_to_remove)
-                anims.append(FadeOut(edge_to_remove))
-
-        scene.play(*anims, run_time=self.cfg.remove_fade_duration)
+        self._remove_last_animated(scene)
 
         if is_slide:
           scene.next_slide()
 
-        if self.len > 0 and idx_to_remove <= self.len:
-            self._heapify_down(scene, idx_to_remove, swap_duration=self.cfg.remove_swap_duration)
+        # The node moved into the slot may belong above it rather than below, as in HeapCore.remove
+        if idx_to_remove <= self.len and self._heapify_down(scene, idx_to_remove, swap_duration=self.cfg.remove_swap_duration) == idx_to_remove:
+            self._heapify_up(scene, idx_to_remove, swap_duration=self.cfg.remove_swap_duration)
 
         self._reposition_all_nodes(scene, duration=self.cfg.insert_reposition_duration)
+        if self.debug: self.check_invariants()
 
+    def _remove_last_animated(self, scene: Scene):
+        """Fades out the node in the last slot together with its array cell and parent edge."""
+        last_idx = self.len
+        node_to_remove = self.nodes.pop(last_idx)
+        self.len -= 1
+
+        anims = [self.array_vis.empty_cell_animated(last_idx)]
+        if isinstance(node_to_remove, CollapsedNode):
+            summary_anim = self._update_summary(self._summary_root(last_idx))
+            if summary_anim: anims.append(summary_anim)
+        else:
+            anims.append(FadeOut(node_to_remove))
+
+        edge_to_remove = self._pop_edge(last_idx)
+        if edge_to_remove:
+            anims.append(FadeOut(edge_to_remove))
+
+        play_changed(scene, *anims, run_time=self.cfg.remove_fade_duration)
+
+    def _comparison_anims(self, indices, deferred: bool = False):
+        anims_highlight, anims_unhighlight = [], []
+        for i in indices:
+            anims_highlight.extend([self.nodes[i].get_highlight_anim(deferred=deferred), self.array_vis.highlight_cell_animated(i, deferred=deferred)])
+            anims_unhighlight.extend([self.nodes[i].get_unhighlight_anim(deferred=deferred), self.array_vis.unhighlight_cell_animated(i, deferred=deferred)])
+        return anims_highlight, anims_unhighlight
+
+    def _play_comparison(self, scene: Scene, indices, pause: float):
+        """Highlights the nodes and cells at `indices`, pauses, then unhighlights them."""
+        anims_highlight, anims_unhighlight = self._comparison_anims(indices)
+        play_changed(scene, *anims_highlight, run_time=self.cfg.highlight_duration)
+        scene.wait(pause)
+        play_changed(scene, *anims_unhighlight, run_time=self.cfg.highlight_duration)
+
+    # --- Sift steps: played immediately, or queued on `steps` when coalescing a whole sift path ---
+    def _compare_step(self, scene: Scene, steps: Optional[list], indices, pause: float):
+        if steps is None:
+            self._play_comparison(scene, indices, pause)
+            return
+        anims_highlight, anims_unhighlight = self._comparison_anims(indices, deferred=True)
+        steps.extend([
+            _step(anims_highlight, self.cfg.highlight_duration),
+            Wait(pause),
+            _step(anims_unhighlight, self.cfg.highlight_duration),
+        ])
+
+    def _swap_step(self, scene: Scene, steps: Optional[list], idx1: int, idx2: int, duration: float):
+        if steps is None:
+            self.swap_nodes(scene, idx1, idx2, duration=duration)
+            return
+        if not self.array_vis.in_window(idx1, idx2):
+            # Sliding the window replaces the cells that the queued steps animate, so those
+            # are played first and the slide gets a play of its own
+            self._play_steps(scene, steps)
+            steps.clear()
+            scene.play(*self.array_vis._ensure_visible(idx1, idx2), run_time=duration)
+        steps.append(_step(self._swap_anims(idx1, idx2, deferred=True), duration))
+
+    def _play_steps(self, scene: Scene, steps: Optional[list]):
+        if steps: scene.play(Succession(*steps))
+
+    @instrumented("MinHeap._heapify_up")
     def _heapify_up(self, scene: Scene, start_idx: int, swap_duration: float):
+        steps = [] if self.coalesce_heapify else None
         current_idx = start_idx
         while current_idx > 1:
             parent_idx = current_idx // 2
-            current_node, parent_node = self.nodes[current_idx], self.nodes[parent_idx]
-
-            anims_highlight = [
-                current_node.get_highlight_anim(),
-                parent_node.get_highlight_anim(),
-                self.array_vis.highlight_cell_animated(current_idx),
-                self.array_vis.highlight_cell_animated(parent_idx)
-            ]
-            scene.play(*anims_highlight, run_time=self.cfg.highlight_duration)
-            scene.wait(0.2)
-
-            anims_unhighlight = [
-                current_node.get_unhighlight_anim(),
-                parent_node.get_unhighlight_anim(),
-                self.array_vis.unhighlight_cell_animated(current_idx),
-                self.array_vis.unhighlight_cell_animated(parent_idx)
-            ]
-
-            if current_node.data < parent_node.data:
-                scene.play(*anims_unhighlight, run_time=self.cfg.highlight_duration)
-                self.swap_nodes(scene, current_idx, parent_idx, duration=swap_duration)
+            self._compare_step(scene, steps, (current_idx, parent_idx), pause=0.2)
+
+            if self._higher(current_idx, parent_idx):
+                self._swap_step(scene, steps, current_idx, parent_idx, duration=swap_duration)
                 current_idx = parent_idx
             else:
-                scene.play(*anims_unhighlight, run_time=self.cfg.highlight_duration)
                 break
+        self._play_steps(scene, steps)
 
-    def _heapify_down(self, scene: Scene, start_idx: int, swap_duration: float):
+    @instrumented("MinHeap._heapify_down")
+    def _heapify_down(self, scene: Scene, start_idx: int, swap_duration: float) -> int:
+        """Sifts the node at start_idx down and returns the slot it ends in."""
+        steps = [] if self.coalesce_heapify else None
         current_idx = start_idx
         while True:
             left_child_idx = 2 * current_idx
             right_child_idx = 2 * current_idx + 1
-            smallest_idx = current_idx
-
-            anims_highlight = [
-                self.nodes[current_idx].get_highlight_anim(),
-                self.array_vis.highlight_cell_animated(current_idx)
-            ]
-            if left_child_idx <= self.len:
-                anims_highlight.extend([
-                    self.nodes[left_child_idx].get_highlight_anim(),
-                    self.array_vis.highlight_cell_animated(left_child_idx)
-                ])
-            if right_child_idx <= self.len:
-                anims_highlight.extend([
-                    self.nodes[right_child_idx].get_highlight_anim(),
-                    self.array_vis.highlight_cell_animated(right_child_idx)
-                ])
-
-            scene.play(*anims_highlight, run_time=self.cfg.highlight_duration)
-            scene.wait(0.3)
-
-            if left_child_idx <= self.len and self.nodes[left_child_idx].data < self.nodes[smallest_idx].data:
-                smallest_idx = left_child_idx
-            if right_child_idx <= self.len and self.nodes[right_child_idx].data < self.nodes[smallest_idx].data:
-                smallest_idx = right_child_idx
-
-            anims_unhighlight = [
-                self.nodes[current_idx].get_unhighlight_anim(),
-                self.array_vis.unhighlight_cell_animated(current_idx)
-            ]
-            if left_child_idx <= self.len:
-                anims_unhighlight.extend([
-                    self.nodes[left_child_idx].get_unhighlight_anim(),
-                    self.array_vis.unhighlight_cell_animated(left_child_idx)
-                ])
-            if right_child_idx <= self.len:
-                anims_unhighlight.extend([
-                    self.nodes[right_child_idx].get_unhighlight_anim(),
-                    self.array_vis.unhighlight_cell_animated(right_child_idx)
-                ])
-            scene.play(*anims_unhighlight, run_time=self.cfg.highlight_duration)
+
+            compared = [i for i in (current_idx, left_child_idx, right_child_idx) if i <= self.len]
+            self._compare_step(scene, steps, compared, pause=0.3)
+            smallest_idx = self._best_of(compared)
 
             if smallest_idx != current_idx:
-                self.swap_nodes(scene, current_idx, smallest_idx, duration=swap_duration)
+                self._swap_step(scene, steps, current_idx, smallest_idx, duration=swap_duration)
                 current_idx = smallest_idx
             else:
                 break
+        self._play_steps(scene, steps)
+        return current_idx
 
     def _reposition_all_nodes(self, scene: Scene, duration: float):
-        anims = [self.nodes[i].animate.move_to(self._get_pos(i)) for i in range(1, self.len + 1)]
-        if anims: scene.play(*anims, run_time=duration)
+        positions = self._get_positions()
+        anims = [self.nodes[i].animate.move_to(positions[i]) for i in range(1, self._visible_len() + 1)]
+        anims += [summary.animate.move_to(positions[root]) for root, summary in self.summaries.items()]
+        if anims: play_changed(scene, *anims, run_time=duration)
 
+    @instrumented("MinHeap.swap_nodes")
     def swap_nodes(self, scene: Scene, idx1: int, idx2: int, duration: float):
         if not (1 <= idx1 <= self.len and 1 <= idx2 <= self.len): return
+        play_changed(scene, *self._swap_anims(idx1, idx2), run_time=duration)
+
+    def _swap_anims(self, idx1: int, idx2: int, deferred: bool = False, move_window: bool = True) -> list:
+        """Builds the node and array swap animations and swaps the two slots."""
         n1, n2 = self.nodes[idx1], self.nodes[idx2]
-        node_swap_anim = AnimationGroup(n1.animate.move_to(n2.get_center()), n2.animate.move_to(n1.get_center()))
-        array_swap_anim = self.array_vis.swap_cells_animated(idx1, idx2)
-        scene.play(node_swap_anim, array_swap_anim, run_time=duration)
-        self.nodes[idx1], self.nodes[idx2] = self.nodes[idx2], self.nodes[idx1]
+        self._swap_keys(idx1, idx2)
+        array_swap_anim = self.array_vis.swap_cells_animated(idx1, idx2, deferred=deferred, move_window=move_window)
+        collapsed1, collapsed2 = isinstance(n1, CollapsedNode), isinstance(n2, CollapsedNode)
+        if collapsed1 == collapsed2:
+            self.nodes[idx1], self.nodes[idx2] = n2, n1
+            if collapsed1:
+                return [array_swap_anim]
+            return [AnimationGroup(_method_anim(n1.move_to, deferred, n2), _method_anim(n2.move_to, deferred, n1)), array_swap_anim]
+
+        old_node, new_node = self._swap_across_lod(idx1, idx2)
+        return [FadeTransform(old_node, new_node), array_swap_anim]
+
+    def _swap_across_lod(self, idx1: int, idx2: int):
+        """
+        Swaps a visible slot with a collapsed one: the value crossing into the visible levels
+        gets a fresh node in place of the one leaving them. Returns (old_node, new_node).
+        """
+        visible_idx, collapsed_idx = (idx2, idx1) if isinstance(self.nodes[idx1], CollapsedNode) else (idx1, idx2)
+        old_node = self.nodes[visible_idx]
+        new_node = BinaryTreeNode(self.nodes[collapsed_idx].data, cfg=self.cfg).move_to(self._get_positions()[visible_idx])
+        self.remove(old_node)
+        self.add(new_node)
+        self.nodes[visible_idx] = new_node
+        self.nodes[collapsed_idx] = CollapsedNode(old_node.data)
+        return old_node, new_node
 
     def translate_array_animated(self, scene: Scene, target_position: np.ndarray, duration: float = 1.0):
-        scene.play(self.array_vis.animate.move_to(target_position), run_time=duration)
+        play_changed(scene, self.array_vis.animate.move_to(target_position), run_time=duration)
 
+    @instrumented("MinHeap.show_indices")
     def show_indices(self, scene: Scene, binary: bool = False, hide_prev = True):
         """Fades in the array index above each node."""
         if (hide_prev):
           self.hide_indices(scene, duration=0.05) # Clear existing before showing new ones
 
         anims = []
-        for i in range(1, self.len + 1):
+        for i in range(1, self._visible_len() + 1):
             node = self.nodes[i]
             label_text = bin(i)[2:] if binary else str(i)
 
-            index_label = Text(
+            index_label = cached_text(
                 label_text,
-                font=self.cfg.font,
-                font_size=self.cfg.font_size,
-                color=self.cfg.index_text_color
+                self.cfg.font,
+                self.cfg.font_size,
+                self.cfg.index_text_color
             ).next_to(node, UP, buff=0.2)
 
             self.index_labels.add(index_label)
@@ -458,14 +955,14 @@ class MinHeap(VGroup):
 
     def highlight_node(self, index: int, scene: Scene, **kwargs):
         if not (1 <= index <= self.len): return
-        scene.play(self.nodes[index].get_highlight_anim(**kwargs),
+        play_changed(scene, self.nodes[index].get_highlight_anim(**kwargs),
                    self.array_vis.highlight_cell_animated(index, **kwargs),
                    run_time=self.cfg.highlight_duration)
 
 
     def unhighlight_node(self, index: int, scene: Scene):
         if not (1 <= index <= self.len): return
-        scene.play(self.nodes[index].get_unhighlight_anim(),
+        play_changed(scene, self.nodes[index].get_unhighlight_anim(),
                    self.array_vis.unhighlight_cell_animated(index),
                    run_time=self.cfg.highlight_duration)
 
@@ -482,5 +979,117 @@ class MinHeap(VGroup):
         self.index_labels.remove(*self.index_labels)
 
 
+    # --- Debugging ---
+    def check_invariants(self):
+        """
+        Asserts the order and shape invariants and that nodes, keys, array cells, summaries,
+        edges and on-screen positions all agree. Runs in O(n), with the order check vectorized
+        for numeric keys.
+        """
+        n = self.len
+        # Shape: slots 1..n are filled, nothing beyond, and only the visible levels have node mobjects
+        assert 0 <= n <= self.limit, f"Heap size {n} outside 0..{self.limit}."
+        assert len(self.nodes) == n + 1, f"nodes holds {len(self.nodes) - 1} entries for a heap of size {n}."
+        visible = self._visible_len()
+        for i in range(1, n + 1):
+            expected = CollapsedNode if i > visible else BinaryTreeNode
+            assert type(self.nodes[i]) is expected, f"Slot {i} holds a {type(self.nodes[i]).__name__}, expected {expected.__name__}."
+
+        # Order: no child has a higher priority than its parent
+        keys = self.keys[:n + 1]
+        if self._numeric_keys():
+            children = np.arange(2, n + 1)
+            bad = children[keys[children] < keys[children // 2]]
+        else:
+            bad = [i for i in range(2, n + 1) if self._higher(i, i // 2)]
+        assert len(bad) == 0, f"Heap order violated at slot {bad[0]} (key {keys[bad[0]]!r} above parent {keys[bad[0] // 2]!r})."
+
+        # Keys, node labels and array values hold the same values
+        for i in range(1, n + 1):
+            assert self.nodes[i].data == keys[i], f"Slot {i}: node holds {self.nodes[i].data!r} but the key array holds {keys[i]!r}."
+        values = self.array_vis.values
+        assert sorted(values) == list(range(1, n + 1)), f"Array cells {sorted(values)} filled for a heap of size {n}."
+        for i in range(1, n + 1):
+            assert values[i] == self.nodes[i].data, f"Slot {i}: array cell holds {values[i]!r} but the node holds {self.nodes[i].data!r}."
+        for i, cell_group in self.array_vis.visible_cells.items():
+            if i in values:
+                assert cell_group[2].original_text == str(values[i]), f"Slot {i}: array cell shows {cell_group[2].original_text!r} instead of {values[i]!r}."
+
+        # Positions: visible nodes and summaries sit in their slots, edges exist exactly for 2.._edge_len()
+        positions = self._get_positions()
+        if visible:
+            centers = np.array([self.nodes[i].get_center() for i in range(1, visible + 1)])
+            drifted = np.flatnonzero(~np.isclose(centers, positions[1:visible + 1]).all(axis=1))
+            assert drifted.size == 0, f"Node in slot {drifted[0] + 1} is at {centers[drifted[0]]}, not {positions[drifted[0] + 1]}."
+        if self.cfg.lod_depth is not None:
+            first_root = 2**self.cfg.lod_depth
+            roots = list(range(first_root, min(n, 2 * first_root - 1) + 1))
+            assert sorted(self.summaries) == roots, f"Summaries for slots {sorted(self.summaries)}, expected {roots}."
+        for root, summary in self.summaries.items():
+            assert summary.count == self._subtree_size(root), f"Summary at slot {root} counts {summary.count} of {self._subtree_size(root)} nodes."
+            assert np.allclose(summary.get_center(), positions[root]), f"Summary at slot {root} is off its slot."
+        assert sorted(self.edge_by_child) == list(range(2, self._edge_len() + 1)), f"Edges into slots {sorted(self.edge_by_child)} for a heap of size {n}."
+
+    def to_core(self, record: bool = True) -> HeapCore:
+        """Returns a headless HeapCore holding the same keys, e.g. to plan operations for HeapTraceRenderer."""
+        core = HeapCore(limit=self.limit, record=record, has_higher_priority=self.has_higher_priority)
+        core.keys = [None] + self.keys[1:self.len + 1].tolist()
+        return core
+
     def __repr__(self):
-        return f"MinHeap({[node.data for node in self.nodes[1:]]})"
+        return f"MinHeap({self.keys[1:self.len + 1].tolist()})"
+
+
+class HeapTraceRenderer:
+    """
+    Replays a HeapCore trace as animations on a MinHeap.
+
+    The heap must start in the state the trace was recorded from (see MinHeap.to_core),
+    e.g. `core = heap.to_core(); core.insert(6); HeapTraceRenderer(heap).render(scene, core.take_trace())`.
+    Durations follow the heap's config, using the initial_* values when is_initial_build is set.
+    """
+    def __init__(self, heap: MinHeap, is_initial_build: bool = False):
+        self.heap = heap
+        self.is_initial_build = is_initial_build
+
+    def render(self, scene: Scene, trace):
+        """Plays every event in the trace, one heap operation (up to each REPOSITION) at a time."""
+        operation = []
+        for event in trace:
+            operation.append(event)
+            if event[0] == REPOSITION:
+                self._render_operation(scene, operation)
+                if self.heap.debug: self.heap.check_invariants()
+                operation = []
+        if operation:
+            self._render_operation(scene, operation)
+
+    def _render_operation(self, scene: Scene, events):
+        heap, cfg = self.heap, self.heap.cfg
+        initial = self.is_initial_build
+        if any(event[0] == EMPTY for event in events):
+            swap_dur = cfg.remove_swap_duration
+        else:
+            swap_dur = cfg.initial_heapify_swap_duration if initial else cfg.insert_heapify_swap_duration
+
+        for event in events:
+            op = event[0]
+            if op == COMPARE:
+                is_sift_up = len(event) == 3 and event[2] == event[1] // 2
+                heap._play_comparison(scene, event[1:], pause=0.2 if is_sift_up else 0.3)
+            elif op == SWAP:
+                heap.swap_nodes(scene, event[1], event[2], duration=swap_dur)
+            elif op == FILL:
+                if event[1] != heap.len + 1: raise ValueError(f"Trace fills slot {event[1]} but the heap's next open slot is {heap.len + 1}.")
+                heap._append_node_animated(
+                    scene, event[2],
+                    create_duration=cfg.initial_create_duration if initial else cfg.insert_create_duration,
+                    edge_duration=cfg.initial_edge_duration if initial else cfg.insert_edge_duration,
+                )
+            elif op == EMPTY:
+                if event[1] != heap.len: raise ValueError(f"Trace empties slot {event[1]} but the heap's last slot is {heap.len}.")
+                heap._remove_last_animated(scene)
+            elif op == REPOSITION:
+                heap._reposition_all_nodes(scene, duration=cfg.initial_reposition_duration if initial else cfg.insert_reposition_duration)
+            else:
+                raise ValueError(f"Unknown heap trace event: {op!r}")
@@ -1,13 +1,33 @@
 from manim import *
-import os
+from .assets import image_size, level_for, load_image
+
+CHONK_ASSET = "chonk.png"
 
 class Chonk(ImageMobject):
   def __init__(self, scale=0.25):
-    base_path = os.path.dirname(__file__)
-    chonk_path = os.path.abspath(os.path.join(base_path, "..", "assets", "chonk.png"))
-    super().__init__(chonk_path)
+    # ImageMobject's default: at this resolution one image row is one screen row
+    resolution = QUALITIES[DEFAULT_QUALITY]["pixel_height"]
+    height = image_size(CHONK_ASSET)[1]
+    # Use the smallest pre-downscaled variant that still covers the rows shown at this render's quality
+    pixels = load_image(CHONK_ASSET, level_for(height, height * scale * config.pixel_height / resolution))
+    super().__init__(pixels[:1, :1], scale_to_resolution=resolution * pixels.shape[0] / height)
+    # Share the cached pixels instead of the copy ImageMobject makes, then size the image from them
+    self.pixel_array = pixels
+    self.reset_points()
     self.scale(scale)
 
+  def _own_pixels(self):
+    if not self.pixel_array.flags.writeable:
+      self.pixel_array = self.pixel_array.copy()
+
+  def set_color(self, color, alpha=None, family=True):
+    self._own_pixels()
+    return super().set_color(color, alpha, family)
+
+  def set_opacity(self, alpha):
+    self._own_pixels()
+    return super().set_opacity(alpha)
+
   def spin(self, scene : Scene, spins = 1, duration = 0.5, ratefunc=None):
     if ratefunc is None:
       ratefunc=linear
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from typing import Optional
+
+# --- Configuration dataclasses ---
+# Kept free of manim imports so tooling can read and build configs without loading the
+# rendering stack. Colors are the hex values of manim's named colors, which every manim
+# color argument accepts; they are private so they never shadow manim's own color names.
+_WHITE = "#FFFFFF"
+_BLACK = "#000000"
+_DARK_GRAY = "#444444"
+_ORANGE = "#FF862F"
+_DARK_BROWN = "#8B4513"
+
+
+# Configuration for the visual properties and animation timings of the heap
+@dataclass
+class BinaryTreeConfig:
+    # --- Node Visual Properties ---
+    node_padding: float = 0.15
+    text_color: str = _BLACK
+    fill_color: str = _WHITE
+    font: str = "JetBrains Mono"
+    node_radius: float = 0.4
+    font_size: float = 24
+
+    # --- Tree Structure Properties ---
+    h_spacing: float = 1.5
+    level_height: float = 1.5
+    edge_color: str = _WHITE
+    edge_width: float = 3.0
+    edge_z_index: int = -1
+    layout: str = "classic"  # "classic" doubles the spacing every level up; "compact" fits the tree into layout_width
+    layout_width: float = 12.0
+    layout_height: Optional[float] = None  # In compact layout, caps the height of the rendered levels
+    lod_depth: Optional[int] = None  # Levels from this depth down are collapsed into one summary glyph per subtree
+
+    # --- Highlight Properties ---
+    highlight_stroke_color: str = _DARK_BROWN
+    highlight_stroke_width: float = 4.0
+    highlight_fill_color: str = _ORANGE
+    highlight_text_color: str = _WHITE
+
+    # --- Array Visual Properties ---
+    array_fill_color: str = _WHITE
+    array_stroke_color: str = _BLACK
+    array_stroke_width: float = 2.0
+    array_text_color: str = _BLACK
+    array_font_size: float = 24
+    array_cell_size: float = 0.8
+    array_cell_spacing: float = 0.1
+    array_empty_stroke_color: str = _DARK_GRAY
+    array_empty_stroke_dashed: bool = True
+    array_window: Optional[int] = None  # Max number of cell mobjects shown at once; None shows the whole array
+
+    # --- Index Label Properties ---
+    index_text_color: str = _ORANGE
+
+    # --- Animation Durations ---
+    initial_create_duration: float = 0.4
+    initial_edge_duration: float = 0.3
+    initial_heapify_swap_duration: float = 0.5
+    initial_reposition_duration: float = 0.7
+    insert_create_duration: float = 0.7
+    insert_edge_duration: float = 0.5
+    insert_heapify_swap_duration: float = 0.7
+    insert_reposition_duration: float = 0.7
+    highlight_duration: float = 0.3
+    remove_swap_duration: float = 0.7
+    remove_fade_duration: float = 0.5
+    label_fade_duration: float = 0.5
+
+
+default_config = BinaryTreeConfig()
+
+
+# --- Configuration for the Priority Queue ---
+@dataclass
+class PriorityQueueConfig:
+    """A dataclass to hold configuration options for the Priority Queue's visuals and animations."""
+    # Visual Properties
+    element_height: float = 0.8
+    element_width: float = 0.8
+    element_fill_color: str = _WHITE
+    element_stroke_color: str = _BLACK
+    element_stroke_width: float = 2.0
+    text_color: str = _BLACK
+    font: str = "JetBrains Mono"
+    font_size: float = 24
+    bar_color: str = _WHITE
+    bar_stroke_width: float = 3.0
+
+    # Highlight Properties
+    highlight_fill_color: str = _ORANGE
+    highlight_stroke_color: str = _DARK_BROWN
+    highlight_text_color: str = _WHITE
+
+    # Structure Properties
+    element_spacing: float = 0.2
+    capacity: int = 10
+
+    # Animation Durations
+    add_duration: float = 1.2  # Default duration for the smooth slide-in animation
+    remove_duration: float = 1.0 # Default duration for the removal animation
+    highlight_duration: float = 0.3
+    default_hang_duration: float = 1.0
+    move_duration: float = 1.0 # Default duration for shifting the whole PQ
+
+
+# Create a default configuration instance
+default_pq_config = PriorityQueueConfig()
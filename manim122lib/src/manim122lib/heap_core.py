@@ -0,0 +1,180 @@
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+import operator
+import numpy as np
+
+# --- Trace events ---
+# A trace is a list of plain tuples (cheap to record by the hundred thousand),
+# all indices 1-based array slots:
+#   (COMPARE, i, j)        sift-up: node i against its parent j
+#   (COMPARE, i, l[, r])   sift-down: node i against its children
+#   (SWAP, i, j)
+#   (FILL, i, value)       value written into the new last slot i
+#   (EMPTY, i, value)      value removed from the last slot i
+#   (REPOSITION,)          end of an operation: everything settles into place
+COMPARE = "compare"
+SWAP = "swap"
+FILL = "fill"
+EMPTY = "empty"
+REPOSITION = "reposition"
+
+HeapEvent = Tuple
+# has_higher_priority(a, b) is True when a belongs above b; the default `<` makes a min-heap
+PriorityFn = Callable[[Any, Any], bool]
+
+
+class HeapCore:
+    """
+    A headless min-heap over plain values, with no mobjects or animations.
+
+    Every operation runs in O(log n) and, when `record` is True, appends the
+    steps it took to `trace` so that a renderer (see HeapTraceRenderer) can
+    replay them on a MinHeap later. Ordering follows `has_higher_priority` (default `<`).
+    """
+    def __init__(self, data: Optional[Iterable[int]] = None, limit: Optional[int] = None, record: bool = True, has_higher_priority: Optional[PriorityFn] = None):
+        self.keys: List[Optional[int]] = [None]
+        self.limit = limit
+        self.record = record
+        self.has_higher_priority = has_higher_priority
+        self._higher = has_higher_priority or operator.lt
+        self.trace: List[HeapEvent] = []
+        self.compares = 0
+        self.swaps = 0
+        for value in data or []:
+            self.insert(value)
+
+    def __len__(self) -> int:
+        return len(self.keys) - 1
+
+    def peek(self) -> int:
+        if len(self.keys) == 1: raise IndexError("Heap is empty.")
+        return self.keys[1]
+
+    def insert(self, value: int) -> int:
+        """Adds a value in the first open slot and sifts it up. Returns its final index."""
+        idx = len(self.keys)
+        if self.limit is not None and idx > self.limit: raise ValueError("Heap limit exceeded.")
+        self.keys.append(value)
+        if self.record: self.trace.append((FILL, idx, value))
+        idx = self.sift_up(idx)
+        if self.record: self.trace.append((REPOSITION,))
+        return idx
+
+    def remove(self, index: int = 1) -> int:
+        """Removes the value at `index` by swapping in the last value and restoring order."""
+        last_idx = len(self.keys) - 1
+        if not (1 <= index <= last_idx): raise IndexError("Heap index out of range.")
+        if index != last_idx:
+            self._swap(index, last_idx)
+        removed = self.keys.pop()
+        if self.record: self.trace.append((EMPTY, last_idx, removed))
+        if index < last_idx and self.sift_down(index) == index:
+            self.sift_up(index)
+        if self.record: self.trace.append((REPOSITION,))
+        return removed
+
+    def pop(self) -> int:
+        return self.remove(1)
+
+    def heapify(self, values: Iterable[int]):
+        """Replaces the contents with `values` using bottom-up (Floyd) construction in O(n)."""
+        values = list(values)
+        if self.limit is not None and len(values) > self.limit: raise ValueError("Heap limit exceeded.")
+        self.keys = [None] + values
+        if self.record:
+            self.trace.extend((FILL, i, value) for i, value in enumerate(values, start=1))
+        for i in range(len(values) // 2, 0, -1):
+            self.sift_down(i)
+        if self.record: self.trace.append((REPOSITION,))
+
+    def sift_up(self, idx: int) -> int:
+        keys, trace, record, higher = self.keys, self.trace, self.record, self._higher
+        value = keys[idx]
+        compares = swaps = 0
+        while idx > 1:
+            parent_idx = idx >> 1
+            compares += 1
+            if record: trace.append((COMPARE, idx, parent_idx))
+            if not higher(value, keys[parent_idx]):
+                break
+            keys[idx], keys[parent_idx] = keys[parent_idx], value
+            swaps += 1
+            if record: trace.append((SWAP, idx, parent_idx))
+            idx = parent_idx
+        self.compares += compares
+        self.swaps += swaps
+        return idx
+
+    def sift_down(self, idx: int) -> int:
+        keys, trace, record, higher = self.keys, self.trace, self.record, self._higher
+        size = len(keys) - 1
+        value = keys[idx]
+        compares = swaps = 0
+        while True:
+            left_idx = idx << 1
+            if left_idx > size:
+                break
+            right_idx = left_idx + 1
+            smallest_idx, smallest = (left_idx, keys[left_idx]) if higher(keys[left_idx], value) else (idx, value)
+            if right_idx <= size:
+                compares += 2
+                if record: trace.append((COMPARE, idx, left_idx, right_idx))
+                if higher(keys[right_idx], smallest):
+                    smallest_idx, smallest = right_idx, keys[right_idx]
+            else:
+                compares += 1
+                if record: trace.append((COMPARE, idx, left_idx))
+            if smallest_idx == idx:
+                break
+            keys[idx], keys[smallest_idx] = smallest, value
+            swaps += 1
+            if record: trace.append((SWAP, idx, smallest_idx))
+            idx = smallest_idx
+        self.compares += compares
+        self.swaps += swaps
+        return idx
+
+    def _swap(self, i: int, j: int):
+        keys = self.keys
+        keys[i], keys[j] = keys[j], keys[i]
+        self.swaps += 1
+        if self.record: self.trace.append((SWAP, i, j))
+
+    def take_trace(self) -> List[HeapEvent]:
+        """Returns the events recorded so far and starts a new trace."""
+        trace, self.trace = self.trace, []
+        return trace
+
+    def is_valid(self) -> bool:
+        keys, higher = self.keys, self._higher
+        return all(not higher(keys[i], keys[i >> 1]) for i in range(2, len(keys)))
+
+    def __repr__(self):
+        return f"HeapCore({self.keys[1:]})"
+
+
+def heapify_order(keys: np.ndarray) -> np.ndarray:
+    """
+    Returns the permutation that min-heap orders a 1-based numeric key array (slot 0 unused),
+    i.e. keys[order] is a heap, with order[0] == 0.
+
+    Same result as HeapCore.heapify, but the sift-downs started on one level run in
+    parallel as NumPy operations, since they work on disjoint subtrees.
+    """
+    heap = np.array(keys, copy=True)
+    order = np.arange(len(heap))
+    size = len(heap) - 1
+    last_parent = size // 2
+    for level in range(last_parent.bit_length() - 1, -1, -1):
+        idx = np.arange(2**level, min(2**(level + 1), last_parent + 1))
+        while idx.size:
+            left = idx * 2
+            smallest = np.where(heap[left] < heap[idx], left, idx)
+            has_right = left + 1 <= size
+            right, current = left[has_right] + 1, smallest[has_right]
+            smallest[has_right] = np.where(heap[right] < heap[current], right, current)
+            moved = smallest != idx
+            idx, smallest = idx[moved], smallest[moved]
+            heap[idx], heap[smallest] = heap[smallest], heap[idx]
+            order[idx], order[smallest] = order[smallest], order[idx]
+            idx = smallest[smallest * 2 <= size]
+    return order
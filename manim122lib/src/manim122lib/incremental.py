@@ -0,0 +1,214 @@
+from manim import *
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Type
+import argparse
+import hashlib
+import json
+import linecache
+import os
+import sys
+from .timeline import TimelineRecorder, load_scene_class
+from . import __version__
+
+# --- Incremental deck builds ---
+# A first pass runs the deck through the timeline dry run (no frames) and fingerprints every
+# slide segment. A segment's fingerprint covers:
+#   - the deck source lines it executed,
+#   - every BinaryTreeConfig/PriorityQueueConfig the library was called with during it,
+#   - the library version and sources,
+#   - the state of the scene when it started, so a change that carries over into later
+#     slides also invalidates those slides.
+# The real render then marks every segment whose fingerprint has a cached mp4 with
+# next_slide(skip_animations=True), so manim skips it. The slides JSON is stitched back
+# together from the fresh and cached entries.
+
+MANIFEST_DIR = ".incremental"
+_LIBRARY_DIR = Path(__file__).resolve().parent
+
+
+def library_fingerprint() -> str:
+    """The library version plus a hash of its sources, so unreleased edits invalidate slides too."""
+    digest = hashlib.sha256(__version__.encode())
+    for path in sorted(_LIBRARY_DIR.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def scene_state_fingerprint(scene: Scene) -> str:
+    """Hashes the points and style of every mobject currently in the scene."""
+    digest = hashlib.sha256()
+    for mob in scene.get_mobject_family_members():
+        digest.update(type(mob).__name__.encode())
+        digest.update(np.ascontiguousarray(mob.points).tobytes())
+        digest.update(str(mob.z_index).encode())
+        if isinstance(mob, VMobject):
+            for rgbas in (mob.fill_rgbas, mob.stroke_rgbas):
+                digest.update(np.ascontiguousarray(rgbas).tobytes())
+            digest.update(str(mob.stroke_width).encode())
+    return digest.hexdigest()
+
+
+class FingerprintRecorder(TimelineRecorder):
+    """
+    A TimelineRecorder that also fingerprints each slide segment (see the module comment).
+
+    `plan` holds, for the start of construct and then for every next_slide call, the index
+    of the slide segment that the following plays belong to.
+    """
+    def __init__(self, scene: Scene, deck_dir: Path):
+        super().__init__(scene)
+        self.deck_dir = str(deck_dir.resolve())
+        self.library_dir = str(_LIBRARY_DIR)
+        self.library = library_fingerprint()
+        self.fingerprints: List[str] = []
+        self.plan: List[int] = [0]
+        self._start_segment()
+
+    def _start_segment(self):
+        self._lines = set()
+        self._configs = set()
+        self._start_state = scene_state_fingerprint(self.scene)
+
+    def _close_segment(self):
+        digest = hashlib.sha256(self.library.encode())
+        digest.update(self._start_state.encode())
+        for filename, lineno in sorted(self._lines):
+            digest.update(f"{os.path.relpath(filename, self.deck_dir)}:{lineno}:{linecache.getline(filename, lineno)}".encode())
+        for config in sorted(self._configs):
+            digest.update(config.encode())
+        self.fingerprints.append(digest.hexdigest())
+
+    def _trace(self, frame, event, arg):
+        filename = frame.f_code.co_filename
+        if filename.startswith(self.library_dir):
+            cfg = frame.f_locals.get("cfg")
+            if cfg is None and hasattr(frame.f_locals.get("self"), "cfg"):
+                cfg = frame.f_locals["self"].cfg
+            if cfg is not None:
+                self._configs.add(repr(cfg))
+            return None
+        if filename.startswith(self.deck_dir):
+            return self._trace_lines
+        return None
+
+    def _trace_lines(self, frame, event, arg):
+        if event == "line":
+            self._lines.add((frame.f_code.co_filename, frame.f_lineno))
+        return self._trace_lines
+
+    def next_slide(self, *args, **kwargs):
+        closing = bool(self.current.events)
+        super().next_slide(*args, **kwargs)
+        if closing:
+            self._close_segment()
+            self._start_segment()
+        self.plan.append(len(self.timeline.slides))
+
+    def finish(self):
+        if self.current.events:
+            self._close_segment()
+        return super().finish()
+
+
+def fingerprint_deck(scene_cls: Type[Scene], deck_dir: Path) -> FingerprintRecorder:
+    """Dry-runs the deck with fingerprinting; returns the finished recorder."""
+    with tempconfig({"dry_run": True, "write_to_movie": False, "disable_caching": True}):
+        scene = scene_cls()
+        recorder = FingerprintRecorder(scene, deck_dir).attach()
+        sys.settrace(recorder._trace)
+        try:
+            scene.setup()
+            scene.construct()
+            scene.tear_down()
+        finally:
+            sys.settrace(None)
+    recorder.finish()
+    return recorder
+
+
+def render_segments(scene_cls: Type[Scene], plan: Sequence[int], render: Sequence[bool]):
+    """
+    Renders the deck for real, skipping (manim_slides skip_animations) every slide segment
+    `i` with render[i] False. The written slides JSON only holds the rendered segments.
+    """
+    scene = scene_cls()
+    calls = iter(plan)
+    original_setup, original_next_slide = scene.setup, scene.next_slide
+
+    def next_slide(*args, skip_animations: bool = False, **kwargs):
+        segment = next(calls)
+        skip = segment < len(render) and not render[segment]
+        original_next_slide(*args, skip_animations=skip_animations or skip, **kwargs)
+
+    def setup():
+        original_setup()
+        first = next(calls)
+        if first < len(render) and not render[first]:
+            original_next_slide(skip_animations=True)
+
+    scene.setup = setup
+    scene.next_slide = next_slide
+    scene.render()
+    return scene
+
+
+def load_manifest(path: Path) -> Dict[str, dict]:
+    """Maps fingerprint to the slides JSON entry rendered for it."""
+    if not path.exists(): return {}
+    return json.loads(path.read_text())["segments"]
+
+
+def build(scene_cls: Type[Scene], deck_dir: Path, output_folder: Path = Path("slides"), force: bool = False) -> List[bool]:
+    """Rebuilds only the invalidated slides of scene_cls. Returns which segments were rendered."""
+    name = scene_cls.__name__
+    slides_path = output_folder / f"{name}.json"
+    manifest_path = output_folder / MANIFEST_DIR / f"{name}.json"
+
+    recorder = fingerprint_deck(scene_cls, deck_dir)
+    segments = recorder.timeline.slides
+    cached = {} if force or not slides_path.exists() else load_manifest(manifest_path)
+
+    def reusable(fingerprint: str) -> bool:
+        entry = cached.get(fingerprint)
+        return entry is not None and Path(entry["file"]).exists() and Path(entry["rev_file"]).exists()
+
+    render = [not segment.skipped and not reusable(fp) for segment, fp in zip(segments, recorder.fingerprints)]
+    if any(render):
+        render_segments(scene_cls, recorder.plan, render)
+    presentation = json.loads(slides_path.read_text())
+    fresh = iter(presentation["slides"] if any(render) else [])
+    if any(render) and len(presentation["slides"]) != sum(render):
+        raise ValueError(f"Expected {sum(render)} rendered slides in {slides_path}, found {len(presentation['slides'])}.")
+
+    # Stitch the fresh entries (in order) and the cached ones back into one deck
+    slides, manifest = [], {}
+    for segment, fingerprint, rendered in zip(segments, recorder.fingerprints, render):
+        if segment.skipped:
+            continue
+        entry = next(fresh) if rendered else cached[fingerprint]
+        slides.append(entry)
+        manifest[fingerprint] = entry
+    presentation["slides"] = slides
+    slides_path.write_text(json.dumps(presentation, indent=2))
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps({"library": recorder.library, "segments": manifest}, indent=2))
+    return render
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Render only the slides whose code, configs or starting state changed since the last build.")
+    parser.add_argument("file", help="Scene file, e.g. main.py (run from the precept folder)")
+    parser.add_argument("scene", help="Slide class name, e.g. PC13")
+    parser.add_argument("--force", action="store_true", help="Ignore the manifest and render every slide")
+    parser.add_argument("--quality", choices=sorted(QUALITIES), help="manim quality preset, e.g. high_quality")
+    args = parser.parse_args(argv)
+
+    if args.quality: config.quality = args.quality
+    scene_cls = load_scene_class(args.file, args.scene)
+    rendered = build(scene_cls, Path(args.file).parent, force=args.force)
+    print(f"{args.scene}: rendered {sum(rendered)} of {len(rendered)} slides")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+import argparse
+import functools
+import inspect
+import json
+import sys
+import time
+
+# --- Instrumentation ---
+# Opt-in per-operation timing and counters for MinHeap and PriorityQueue. While a sink is
+# enabled, every decorated library call emits one record to it when it returns:
+#   - wall_time: total seconds in the call,
+#   - play_time: seconds spent inside scene.play,
+#   - wait_time: seconds spent inside scene.wait,
+#   - build_time: the rest (building mobjects and animations, heap logic),
+#   - counters: plays, waits, compares, swaps, shifts and mobjects_created
+#     (new Mobjects, including the ones made by Mobject.copy).
+# Nested calls (add_node -> _heapify_up -> ...) emit their own records and also count
+# toward their callers. When no sink is enabled the decorators cost one global check.
+#
+# Nothing is traced unless enabled explicitly: with enable()/instrumented_run() in code, or
+# for a whole render with
+#   python -m manim122lib.instrument record trace.jsonl main.py PC13
+#   python -m manim122lib.instrument summarize trace.jsonl
+
+Sink = Callable[[dict], None]
+
+
+class JsonlSink:
+    """Appends every record to a JSON lines file."""
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "a")
+
+    def __call__(self, record: dict):
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class ListSink(list):
+    """Keeps every record in memory."""
+    def __call__(self, record: dict):
+        self.append(record)
+
+
+class _Operation:
+    __slots__ = ("name", "start", "play_time", "wait_time", "counters")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.start = time.perf_counter()
+        self.play_time = 0.0
+        self.wait_time = 0.0
+        self.counters: Dict[str, int] = defaultdict(int)
+
+
+_sink: Optional[Sink] = None
+_stack: List[_Operation] = []
+_mobject_init = None
+_mobject_copy = None
+# True while inside a timed scene.play or scene.wait, so a wait that plays is timed once
+_in_scene_call = False
+
+
+def enable(sink: Sink):
+    """Starts sending operation records to sink, and counts every Mobject created or copied."""
+    global _sink, _mobject_init, _mobject_copy
+    from manim import Mobject
+    if _mobject_init is None:
+        _mobject_init, _mobject_copy = Mobject.__init__, Mobject.copy
+
+        @functools.wraps(_mobject_init)
+        def counting_init(self, *args, **kwargs):
+            count("mobjects_created")
+            _mobject_init(self, *args, **kwargs)
+
+        @functools.wraps(_mobject_copy)
+        def counting_copy(self, *args, **kwargs):
+            # A copy is deep-copied without calling __init__: count its whole family
+            copied = _mobject_copy(self, *args, **kwargs)
+            count("mobjects_created", len(copied.get_family()))
+            return copied
+
+        Mobject.__init__ = counting_init
+        Mobject.copy = counting_copy
+    _sink = sink
+
+
+def disable():
+    global _sink, _mobject_init, _mobject_copy
+    if _mobject_init is not None:
+        from manim import Mobject
+        Mobject.__init__ = _mobject_init
+        Mobject.copy = _mobject_copy
+        _mobject_init = _mobject_copy = None
+    _sink = None
+
+
+@contextmanager
+def instrumented_run(sink: Sink):
+    """Enables sink for the duration of the with block."""
+    enable(sink)
+    try:
+        yield sink
+    finally:
+        disable()
+
+
+def count(counter: str, n: int = 1):
+    """Adds n to a counter of every operation in progress."""
+    for op in _stack:
+        op.counters[counter] += n
+
+
+def _timed(method, kind: str):
+    """Wraps scene.play or scene.wait (kind "play" or "wait") to add its time and a call to every operation in progress."""
+    @functools.wraps(method)
+    def timed(*args, **kwargs):
+        global _in_scene_call
+        if _in_scene_call:
+            return method(*args, **kwargs)
+        _in_scene_call = True
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _in_scene_call = False
+            elapsed = time.perf_counter() - start
+            for op in _stack:
+                setattr(op, f"{kind}_time", getattr(op, f"{kind}_time") + elapsed)
+                op.counters[f"{kind}s"] += 1
+    return timed
+
+
+@contextmanager
+def operation(name: str, scene=None):
+    """Times the with block as one operation; the outermost one also times scene.play and scene.wait."""
+    op = _Operation(name)
+    patched = scene is not None and not _stack
+    if patched:
+        previous = {kind: scene.__dict__.get(kind) for kind in ("play", "wait")}
+        for kind in previous:
+            setattr(scene, kind, _timed(getattr(scene, kind), kind))
+    _stack.append(op)
+    try:
+        yield op
+    finally:
+        _stack.pop()
+        if patched:
+            for kind, method in previous.items():
+                if method is None: delattr(scene, kind)
+                else: setattr(scene, kind, method)
+        wall_time = time.perf_counter() - op.start
+        if _sink is not None:
+            _sink({
+                "op": name,
+                "parent": _stack[-1].name if _stack else None,
+                "wall_time": wall_time,
+                "play_time": op.play_time,
+                "wait_time": op.wait_time,
+                "build_time": wall_time - op.play_time - op.wait_time,
+                **{counter: op.counters.get(counter, 0) for counter in ("plays", "waits", "compares", "swaps", "shifts", "mobjects_created")},
+            })
+
+
+def instrumented(name: str):
+    """Decorates a library method taking a `scene` argument as an instrumented operation."""
+    def decorate(fn):
+        scene_index = list(inspect.signature(fn).parameters).index("scene")
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if _sink is None:
+                return fn(*args, **kwargs)
+            scene = kwargs.get("scene", args[scene_index] if len(args) > scene_index else None)
+            with operation(name, scene):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def summarize(records: List[dict]) -> str:
+    """Totals per operation, most expensive first."""
+    totals: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    for record in records:
+        total = totals[record["op"]]
+        total["calls"] += 1
+        for key, value in record.items():
+            if isinstance(value, (int, float)): total[key] += value
+    lines = [f"{'Operation':<28} {'Calls':>6} {'Wall (s)':>9} {'Play (s)':>9} {'Wait (s)':>9} {'Build (s)':>10} {'Plays':>6} {'Waits':>6} {'Compares':>9} {'Swaps':>6} {'Mobjects':>9}"]
+    for name, total in sorted(totals.items(), key=lambda item: -item[1]["wall_time"]):
+        lines.append(
+            f"{name:<28} {int(total['calls']):>6} {total['wall_time']:>9.3f} {total['play_time']:>9.3f} {total['wait_time']:>9.3f} {total['build_time']:>10.3f} "
+            f"{int(total['plays']):>6} {int(total['waits']):>6} {int(total['compares']):>9} {int(total['swaps']):>6} {int(total['mobjects_created']):>9}"
+        )
+    return "\n".join(lines)
+
+
+def record_render(path: str, scene_name: str, trace: str, quality: Optional[str] = None):
+    """Renders scene_name from the file at path with a JsonlSink writing to trace enabled for the whole render."""
+    from manim import config
+    from .timeline import load_scene_class
+    if quality: config.quality = quality
+    scene = load_scene_class(path, scene_name)()
+    sink = JsonlSink(trace)
+    try:
+        with instrumented_run(sink):
+            scene.render()
+    finally:
+        sink.close()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Trace the library operations of a render, or summarize a trace.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="Render a deck with tracing enabled")
+    record.add_argument("trace", help="JSON lines file to append the records to")
+    record.add_argument("file", help="Scene file, e.g. main.py (run from the precept folder)")
+    record.add_argument("scene", help="Scene or Slide class name, e.g. PC13")
+    record.add_argument("--quality", help="manim quality preset, e.g. high_quality")
+    summary = commands.add_parser("summarize", help="Print per-operation totals of a trace")
+    summary.add_argument("trace", help="JSON lines trace file")
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        record_render(args.file, args.scene, args.trace, args.quality)
+        print(f"{args.scene}: wrote {args.trace}")
+        return
+    with open(args.trace) as f:
+        print(summarize([json.loads(line) for line in f if line.strip()]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
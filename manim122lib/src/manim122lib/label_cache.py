@@ -0,0 +1,59 @@
+from manim import *
+from collections import OrderedDict
+from typing import Tuple
+
+LabelKey = Tuple[str, str, float, str]
+
+
+class LabelCache:
+    """
+    A bounded LRU cache of rendered Text labels shared across the library.
+
+    Building a Text goes through Pango and SVG parsing, so labels are rendered
+    once per (text, font, font_size, color) and callers receive a copy.
+    """
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._labels: "OrderedDict[LabelKey, Text]" = OrderedDict()
+
+    def get(self, text, font: str, font_size: float, color) -> Text:
+        """Returns a fresh copy of the label, rendering it only on a cache miss."""
+        key = (str(text), font, float(font_size), str(color))
+        label = self._labels.get(key)
+        if label is None:
+            self.misses += 1
+            label = Text(str(text), font=font, font_size=font_size, color=color)
+            if self.max_size > 0:
+                self._labels[key] = label
+                while len(self._labels) > self.max_size:
+                    self._labels.popitem(last=False)
+        else:
+            self.hits += 1
+            self._labels.move_to_end(key)
+        return label.copy()
+
+    def clear(self):
+        """Drops every cached label and resets the hit/miss counters."""
+        self._labels.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        return {"size": len(self._labels), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __repr__(self):
+        return f"LabelCache(size={len(self._labels)}, max_size={self.max_size}, hits={self.hits}, misses={self.misses})"
+
+
+# The process-wide cache used by BinaryTreeNode, HeapArray, MinHeap and QueueElement
+label_cache = LabelCache()
+
+
+def cached_text(text, font: str, font_size: float, color) -> Text:
+    """Shorthand for label_cache.get(...)."""
+    return label_cache.get(text, font, font_size, color)
@@ -0,0 +1,137 @@
+from manim import *
+from manim.utils.exceptions import EndSceneEarlyException
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+from .timeline import TimelineRecorder, load_scene_class
+
+# --- Parallel section rendering ---
+# A deck declares where it can be split with section_boundary(self, name), placed right after
+# a next_slide() so that every section starts on a slide of its own. Section k is
+# rendered in its own process: everything before boundary k is replayed without rendering
+# (the timeline dry run, so the entry state is rebuilt in seconds), section k is rendered
+# for real, and the render stops at boundary k + 1. The per-section slides JSON files are
+# then stitched back together in order.
+
+SECTIONS_DIR = ".sections"
+_PATCHED = ("play", "wait", "next_slide", "next_section")
+
+
+def section_boundary(scene: Scene, name: str = ""):
+    """
+    Declares that the deck can be split here for parallel rendering. It only marks the split:
+    a normal render ignores it, so it must follow a next_slide() for serial and parallel
+    builds to produce the same slides.
+    """
+    hook = getattr(scene, "_section_boundary", None)
+    if hook is not None:
+        hook(name)
+
+
+class SectionController:
+    """Runs one section of a scene for real and everything before it as a dry run."""
+    def __init__(self, scene: Scene, section: int):
+        self.scene = scene
+        self.section = section
+        self.boundaries = 0
+        scene._section_boundary = self.boundary
+        if section > 0:
+            TimelineRecorder(scene).attach()
+
+    def boundary(self, name: str):
+        self.boundaries += 1
+        if self.boundaries == self.section:
+            for method in _PATCHED:
+                self.scene.__dict__.pop(method, None)
+        elif self.boundaries > self.section:
+            raise EndSceneEarlyException()
+
+
+def count_sections(scene_cls: type) -> int:
+    """Dry-runs the deck and returns the number of sections its boundaries split it into."""
+    with tempconfig({"dry_run": True, "write_to_movie": False, "disable_caching": True}):
+        scene = scene_cls()
+        recorder = TimelineRecorder(scene).attach()
+        names = []
+
+        def boundary(name: str):
+            if recorder.current.events:
+                raise ValueError(f"section_boundary {name!r} splits slide {recorder.current.index}; call it right after next_slide().")
+            names.append(name)
+
+        scene._section_boundary = boundary
+        scene.setup()
+        scene.construct()
+        scene.tear_down()
+    return len(names) + 1
+
+
+def render_section(path: str, scene_name: str, section: int, output_folder: str, quality: Optional[str] = None) -> str:
+    """Worker entry point: renders one section into its own media and slides folders. Returns its slides JSON path."""
+    if quality: config.quality = quality
+    config.media_dir = str(Path(config.media_dir) / SECTIONS_DIR / str(section))
+    config.output_file = f"{scene_name}_section{section}"
+    scene = load_scene_class(path, scene_name)()
+    scene._output_folder = Path(output_folder) / SECTIONS_DIR / str(section)
+    SectionController(scene, section)
+    scene.render()
+    return str(scene._output_folder / f"{scene_name}.json")
+
+
+def stitch_sections(section_files: List[str], scene_name: str, output_folder: Path) -> Path:
+    """Moves every section's videos into output_folder/files/<scene> and writes one slides JSON in section order."""
+    files_folder = output_folder / "files" / scene_name
+    files_folder.mkdir(parents=True, exist_ok=True)
+    presentation, slides = None, []
+
+    def adopt(file: str) -> str:
+        src, dst = Path(file), files_folder / Path(file).name
+        if src.exists() and src.resolve() != dst.resolve():
+            os.replace(src, dst)
+        return str(dst)
+
+    for section_file in section_files:
+        section = json.loads(Path(section_file).read_text())
+        if presentation is None: presentation = section
+        for slide in section["slides"]:
+            same = slide["rev_file"] == slide["file"]
+            slide["file"] = adopt(slide["file"])
+            slide["rev_file"] = slide["file"] if same else adopt(slide["rev_file"])
+            slides.append(slide)
+    presentation["slides"] = slides
+    slides_path = output_folder / f"{scene_name}.json"
+    slides_path.write_text(json.dumps(presentation, indent=2))
+    shutil.rmtree(output_folder / SECTIONS_DIR, ignore_errors=True)
+    return slides_path
+
+
+def build(path: str, scene_name: str, output_folder: Path = Path("slides"), workers: Optional[int] = None, quality: Optional[str] = None) -> Path:
+    """Renders every section of the deck in parallel and stitches them into output_folder/<scene>.json."""
+    sections = count_sections(load_scene_class(path, scene_name))
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=context) as pool:
+        futures = [pool.submit(render_section, path, scene_name, k, str(output_folder), quality) for k in range(sections)]
+        section_files = [future.result() for future in futures]
+    return stitch_sections(section_files, scene_name, output_folder)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Render a deck's sections (see section_boundary) in parallel processes.")
+    parser.add_argument("file", help="Scene file, e.g. main.py (run from the precept folder)")
+    parser.add_argument("scene", help="Slide class name, e.g. PC13")
+    parser.add_argument("--workers", type=int, help="Number of worker processes (default: all cores)")
+    parser.add_argument("--quality", choices=sorted(QUALITIES), help="manim quality preset, e.g. high_quality")
+    args = parser.parse_args(argv)
+
+    slides_path = build(args.file, args.scene, workers=args.workers, quality=args.quality)
+    print(f"{args.scene}: wrote {slides_path}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+from manim import *
+from manim.animation.animation import prepare_animation
+from typing import Iterable, List
+import numpy as np
+
+# --- No-op animation elimination ---
+# Library code builds plenty of animations that end where they start: repositioning every
+# node after an insert even though only a few moved, restyling a node to the colors it
+# already has, or empty AnimationGroups for cells that are not filled. They still cost
+# per-frame interpolation and mark their mobjects as moving, so they are dropped here
+# before reaching scene.play.
+
+
+def _flatten(animations: Iterable) -> Iterable[Animation]:
+    """Yields the animations, unpacking plain AnimationGroups whose children all share the group's timing. None is skipped."""
+    for anim in animations:
+        if anim is None:
+            continue
+        anim = prepare_animation(anim)
+        if (type(anim) is AnimationGroup and anim.lag_ratio == 0 and anim.rate_func is linear
+                and all(child.run_time == anim.run_time for child in anim.animations)):
+            yield from _flatten(anim.animations)
+        else:
+            yield anim
+
+
+def _same_state(mobject: Mobject, target: Mobject) -> bool:
+    family, target_family = mobject.get_family(), target.get_family()
+    if len(family) != len(target_family):
+        return False
+    for mob, target_mob in zip(family, target_family):
+        # Only VMobject state is compared; anything else is assumed to change
+        if not isinstance(mob, VMobject) or type(mob) is not type(target_mob):
+            return False
+        if mob.points.shape != target_mob.points.shape or not np.allclose(mob.points, target_mob.points):
+            return False
+        for attr in ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"):
+            rgbas, target_rgbas = getattr(mob, attr), getattr(target_mob, attr)
+            if rgbas.shape != target_rgbas.shape or not np.allclose(rgbas, target_rgbas):
+                return False
+        if mob.stroke_width != target_mob.stroke_width or mob.background_stroke_width != target_mob.background_stroke_width:
+            return False
+    return True
+
+
+def _prune(animations: List[Animation]) -> List[Animation]:
+    # MoveToTarget covers every `mob.animate...` animation; its target is known up front
+    noop = {id(anim): _same_state(anim.mobject, anim.target_mobject) for anim in animations if isinstance(anim, MoveToTarget)}
+    # When several transforms target the same mobject the last one overwrites the others every
+    # frame, so if that one is a no-op the mobject does not change at all
+    last_on = {id(anim.mobject): anim for anim in animations if id(anim) in noop}
+    return [
+        anim for anim in animations
+        if id(anim) not in noop or not (noop[id(anim)] or noop[id(last_on[id(anim.mobject)])])
+    ]
+
+
+def prune_noop_animations(animations: Iterable) -> List[Animation]:
+    """Returns the animations that change something, with plain AnimationGroups unpacked."""
+    return _prune(list(_flatten(animations)))
+
+
+def play_changed(scene: Scene, *animations, **kwargs):
+    """
+    scene.play without the animations whose start and end states match.
+
+    If nothing is left, the scene waits for the same run time instead so the pacing
+    of the slide is unchanged.
+    """
+    flat = list(_flatten(animations))
+    kept = _prune(flat)
+    if kept:
+        scene.play(*kept, **kwargs)
+        return
+    run_time = kwargs.get("run_time")
+    if run_time is None:
+        run_time = max((anim.run_time for anim in flat), default=0)
+    if run_time > 0:
+        scene.wait(run_time)
@@ -0,0 +1,166 @@
+from pathlib import Path
+from typing import List, Optional
+import argparse
+import json
+import re
+import struct
+import sys
+from .transcode import VARIANTS_FILE
+
+# --- Preload-aware HTML ---
+# Post-processes the reveal.js page written by `manim-slides convert`. It embeds a manifest
+# with the source, size and duration of each slide's video, and a small script that
+# prefetches the next `ahead` slides as the presenter moves through the deck. Reversed
+# videos are never listed, so they are never prefetched. reveal.js's own viewDistance is
+# lowered to `ahead` so the first page load only pulls the opening slides. When the deck has
+# been transcoded (see transcode.py), the script first picks one rung of the resolution
+# ladder for the whole deck from the screen size and connection. Add ?quality=720 to the
+# URL to force a rung.
+
+_BEGIN = "<!-- manim122lib preload -->"
+_END = "<!-- /manim122lib preload -->"
+_SECTION_VIDEO = re.compile(r'<section\b[^>]*?data-background-video="([^"]+)"', re.S)
+_REVEAL_INIT = re.compile(r"<script>\s*Reveal\.initialize\(")
+
+_POLICY = r"""<script>
+            (function () {
+                var manifest = JSON.parse(document.getElementById("slide-manifest").textContent);
+                var prefetched = {};
+                function pickHeight() {
+                    var forced = /[?&]quality=(\d+)/.exec(location.search);
+                    if (forced) return +forced[1];
+                    var height = screen.height * (window.devicePixelRatio || 1);
+                    var connection = navigator.connection;
+                    if (connection && (connection.saveData || connection.downlink < 2)) height = Math.min(height, 480);
+                    else if (connection && connection.downlink < 5) height = Math.min(height, 720);
+                    return height;
+                }
+                // Runs before Reveal.initialize, so reveal.js only ever loads the chosen rung
+                var height = pickHeight();
+                var sections = document.querySelectorAll(".reveal .slides > section[data-background-video]");
+                manifest.slides.forEach(function (slide, index) {
+                    if (!slide.variants) return;
+                    var chosen = slide.variants[slide.variants.length - 1];
+                    for (var i = 0; i < slide.variants.length; i++) {
+                        if (slide.variants[i].height >= height) { chosen = slide.variants[i]; break; }
+                    }
+                    slide.src = chosen.src;
+                    slide.bytes = chosen.bytes;
+                    if (sections[index]) sections[index].setAttribute("data-background-video", chosen.src);
+                });
+                function prefetch(index) {
+                    var slide = manifest.slides[index];
+                    if (!slide || prefetched[slide.src]) return;
+                    prefetched[slide.src] = true;
+                    var link = document.createElement("link");
+                    link.rel = "prefetch";
+                    link.as = "video";
+                    link.href = slide.src;
+                    document.head.appendChild(link);
+                }
+                function update() {
+                    var current = Reveal.getIndices().h;
+                    for (var i = 1; i <= manifest.ahead; i++) prefetch(current + i);
+                    // Let the background videos reveal.js already created for those slides buffer fully
+                    Reveal.getSlides().slice(current + 1, current + 1 + manifest.ahead).forEach(function (slide) {
+                        var content = slide.slideBackgroundContentElement;
+                        var video = content && content.querySelector("video");
+                        if (video && video.preload !== "auto") {
+                            video.preload = "auto";
+                            video.load();
+                        }
+                    });
+                }
+                if (Reveal.isReady()) update();
+                else Reveal.on("ready", update);
+                Reveal.on("slidechanged", update);
+            })();
+        </script>"""
+
+
+def mp4_duration(path: Path) -> Optional[float]:
+    """
+    Reads the duration in seconds from an mp4's mvhd box, or None if it cannot be found.
+    Only box headers are read on the way there: boxes other than moov are skipped with seek.
+    """
+    with open(path, "rb") as f:
+        offset, end = 0, f.seek(0, 2)
+        while offset + 8 <= end:
+            f.seek(offset)
+            size, kind = struct.unpack(">I4s", f.read(8))
+            header = 8
+            if size == 1:
+                large = f.read(8)
+                if len(large) < 8: return None
+                size, header = struct.unpack(">Q", large)[0], 16
+            elif size == 0:
+                size = end - offset
+            if size < header: return None
+            if kind == b"moov":
+                # Descend into moov
+                end, offset = min(end, offset + size), offset + header
+                continue
+            if kind == b"mvhd":
+                # version, flags, then creation and modification times of 4 or 8 bytes each
+                fields = f.read(min(32, size - header))
+                if not fields: return None
+                version = fields[0]
+                layout, start = (">IQ", 20) if version == 1 else (">II", 12)
+                if len(fields) < start + struct.calcsize(layout): return None
+                timescale, duration = struct.unpack(layout, fields[start:start + struct.calcsize(layout)])
+                return duration / timescale if timescale else None
+            offset += size
+    return None
+
+
+def build_manifest(html_path: Path, ahead: int) -> dict:
+    """Lists every slide's forward video with its size in bytes, duration in seconds and any transcoded variants."""
+    variants_path = html_path.parent / VARIANTS_FILE
+    variants = json.loads(variants_path.read_text()) if variants_path.exists() else {}
+    slides = []
+    for src in _SECTION_VIDEO.findall(html_path.read_text()):
+        video = html_path.parent / src
+        size = duration = None
+        if video.exists():
+            size, duration = video.stat().st_size, mp4_duration(video)
+        slide = {"src": src, "bytes": size, "duration": None if duration is None else round(duration, 3)}
+        if src in variants:
+            slide["variants"] = variants[src]["variants"]
+        slides.append(slide)
+    return {"ahead": ahead, "slides": slides}
+
+
+def add_preload(html_path: Path, ahead: int = 2) -> dict:
+    """Embeds the manifest and prefetch policy into html_path (replacing any earlier one). Returns the manifest."""
+    html = html_path.read_text()
+    html = re.sub(re.escape(_BEGIN) + ".*?" + re.escape(_END) + r"\s*", "", html, flags=re.S)
+    manifest = build_manifest(html_path, ahead)
+    block = (
+        f"{_BEGIN}\n"
+        f'        <script id="slide-manifest" type="application/json">{json.dumps(manifest)}</script>\n'
+        f"        {_POLICY}\n"
+        f"        {_END}\n"
+    )
+    html = re.sub(r"viewDistance: \d+", f"viewDistance: {max(ahead, 1)}", html)
+    html = re.sub(r"mobileViewDistance: \d+", f"mobileViewDistance: {max(min(ahead, 2), 1)}", html)
+    # Before Reveal.initialize, so the variant choice lands before reveal.js loads any video
+    init = _REVEAL_INIT.search(html)
+    index = init.start() if init else html.rindex("</body>")
+    html = html[:index] + block + "        " + html[index:]
+    html_path.write_text(html)
+    return manifest
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Add a video manifest and next-slide prefetching to a manim-slides HTML export.")
+    parser.add_argument("html", help="HTML file written by manim-slides convert, e.g. pc13/slides.html")
+    parser.add_argument("--ahead", type=int, default=2, help="Number of upcoming slides to prefetch (default: 2)")
+    args = parser.parse_args(argv)
+
+    manifest = add_preload(Path(args.html), ahead=args.ahead)
+    total = sum(slide["bytes"] or 0 for slide in manifest["slides"])
+    print(f"{args.html}: {len(manifest['slides'])} slides, {total / 1e6:.1f} MB of video, prefetching {args.ahead} ahead")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
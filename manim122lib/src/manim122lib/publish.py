@@ -0,0 +1,136 @@
+from pathlib import Path
+from typing import Dict, List, Optional
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+# --- Content-addressed publishing ---
+# manim-slides keeps every slide video under slides/files/<Scene>, and convert copies the
+# forward ones again into index_assets for the HTML. Renders also often produce
+# byte-identical videos under different names. publish() moves every referenced video
+# into one store named by content hash (assets/<sha256>.mp4), points the slides JSON and
+# the HTML at it, and records the original names in assets/manifest.json. The incremental
+# build manifest (slides/.incremental/<Scene>.json) is rewritten the same way, so publishing
+# does not force a full re-render. Videos left
+# behind in those two generated folders by earlier renders are no longer referenced by
+# anything and are deleted, unless prune is False.
+
+STORE_DIR = "assets"
+# incremental.MANIFEST_DIR, repeated here so publishing does not import manim
+INCREMENTAL_DIR = ".incremental"
+_HTML_VIDEO = re.compile(r'((?:data-background-video|src)=")([^"]+\.mp4)(")')
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ContentStore:
+    """A folder of files named by the SHA-256 of their bytes, so identical videos are stored once."""
+    def __init__(self, deck_dir: Path, name: str = STORE_DIR):
+        self.deck_dir = deck_dir
+        self.name = name
+        self.folder = deck_dir / name
+        self.manifest_path = self.folder / "manifest.json"
+        self.manifest: Dict[str, str] = json.loads(self.manifest_path.read_text()) if self.manifest_path.exists() else {}
+        self.bytes_saved = 0
+
+    def add(self, ref: str, link_original: bool = False) -> str:
+        """Moves the deck-relative file `ref` into the store and returns its store reference."""
+        if ref.startswith(self.name + "/"):
+            return ref
+        src = self.deck_dir / ref
+        if not src.exists():
+            if ref in self.manifest: return self.manifest[ref]
+            raise FileNotFoundError(f"Video {ref} referenced by the deck does not exist.")
+        stored = f"{self.name}/{file_digest(src)}{src.suffix}"
+        dst = self.deck_dir / stored
+        self.folder.mkdir(parents=True, exist_ok=True)
+        if dst.exists():
+            if os.path.samefile(src, dst):
+                self.manifest[ref] = stored
+                return stored
+            self.bytes_saved += src.stat().st_size
+            src.unlink()
+        else:
+            os.replace(src, dst)
+        if link_original:
+            os.link(dst, src)
+        self.manifest[ref] = stored
+        return stored
+
+    def save(self):
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(self.manifest, indent=2, sort_keys=True))
+
+
+def publish(deck_dir: Path, scene_name: str, html_files: Optional[List[str]] = None, link_originals: bool = False, prune: bool = True) -> ContentStore:
+    """
+    Moves every video referenced by slides/<scene_name>.json and the HTML files into the
+    content store and rewrites their references. With link_originals, the old paths stay
+    as hardlinks to the store (useful locally, so manim-slides keeps reusing them).
+    """
+    store = ContentStore(deck_dir)
+
+    slides_path = deck_dir / "slides" / f"{scene_name}.json"
+    if slides_path.exists():
+        presentation = json.loads(slides_path.read_text())
+        for slide in presentation["slides"]:
+            for key in ("file", "rev_file"):
+                if slide.get(key):
+                    slide[key] = store.add(slide[key], link_originals)
+        slides_path.write_text(json.dumps(presentation, indent=2))
+
+    incremental_path = deck_dir / "slides" / INCREMENTAL_DIR / f"{scene_name}.json"
+    if incremental_path.exists():
+        cache = json.loads(incremental_path.read_text())
+        for entry in cache["segments"].values():
+            for key in ("file", "rev_file"):
+                ref = entry.get(key)
+                # Entries whose video is already gone are left alone: incremental re-renders them
+                if ref and (ref in store.manifest or (deck_dir / ref).exists()):
+                    entry[key] = store.add(ref, link_originals)
+        incremental_path.write_text(json.dumps(cache, indent=2))
+
+    for html_name in html_files if html_files is not None else ["slides.html"]:
+        html_path = deck_dir / html_name
+        if not html_path.exists(): continue
+        html = _HTML_VIDEO.sub(lambda m: m.group(1) + store.add(m.group(2), link_originals) + m.group(3), html_path.read_text())
+        html_path.write_text(html)
+
+    store.save()
+    for folder in (deck_dir / "index_assets", deck_dir / "slides" / "files" / scene_name, deck_dir / "slides" / "files"):
+        if not folder.is_dir(): continue
+        if prune:
+            for video in folder.glob("*.mp4"):
+                if video.relative_to(deck_dir).as_posix() not in store.manifest:
+                    store.bytes_saved += video.stat().st_size
+                    video.unlink()
+        if not any(folder.iterdir()):
+            folder.rmdir()
+    return store
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Deduplicate a converted deck's videos into a content-addressed store.")
+    parser.add_argument("deck", help="Precept folder, e.g. pc13")
+    parser.add_argument("scene", help="Slide class name, e.g. PC13")
+    parser.add_argument("--html", nargs="*", help="HTML files to rewrite (default: slides.html)")
+    parser.add_argument("--link-originals", action="store_true", help="Keep the old paths as hardlinks to the store")
+    parser.add_argument("--keep-unreferenced", action="store_true", help="Do not delete stale videos from earlier renders")
+    args = parser.parse_args(argv)
+
+    store = publish(Path(args.deck), args.scene, html_files=args.html, link_originals=args.link_originals, prune=not args.keep_unreferenced)
+    stored = len(set(store.manifest.values()))
+    print(f"{args.scene}: {len(store.manifest)} video references stored as {stored} files in {store.folder} ({store.bytes_saved / 1e6:.1f} MB of duplicate or stale videos removed)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
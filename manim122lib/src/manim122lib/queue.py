@@ -1,45 +1,11 @@
 from manim import *
 from typing import List, Optional
-from dataclasses import dataclass
 import numpy as np
 import bisect
-
-# --- Configuration for the Priority Queue ---
-@dataclass
-class PriorityQueueConfig:
-    """A dataclass to hold configuration options for the Priority Queue's visuals and animations."""
-    # Visual Properties
-    element_height: float = 0.8
-    element_width: float = 0.8
-    element_fill_color: str = WHITE
-    element_stroke_color: str = BLACK
-    element_stroke_width: float = 2.0
-    text_color: str = BLACK
-    font: str = "JetBrains Mono"
-    font_size: float = 24
-    bar_color: str = WHITE
-    bar_stroke_width: float = 3.0
-
-    # Highlight Properties
-    highlight_fill_color: str = ORANGE
-    highlight_stroke_color: str = DARK_BROWN
-    highlight_text_color: str = WHITE
-
-    # Structure Properties
-    element_spacing: float = 0.2
-    capacity: int = 10
-
-    # Animation Durations
-    add_duration: float = 1.2  # Default duration for the smooth slide-in animation
-    remove_duration: float = 1.0 # Default duration for the removal animation
-    highlight_duration: float = 0.3
-    default_hang_duration: float = 1.0
-    move_duration: float = 1.0 # Default duration for shifting the whole PQ
-
-
-# Create a default configuration instance
-default_pq_config = PriorityQueueConfig()
-
+from .label_cache import cached_text
+from .playback import play_changed
+from .instrument import instrumented, count
+from .configs import PriorityQueueConfig, default_pq_config
 
 # --- Class for a Single Queue Element ---
 class QueueElement(VGroup):
@@ -57,7 +23,7 @@ class QueueElement(VGroup):
             stroke_color=cfg.element_stroke_color,
             stroke_width=cfg.element_stroke_width
         )
-        self.label = Text(str(data), font=cfg.font, font_size=cfg.font_size, color=cfg.text_color)
+        self.label = cached_text(data, cfg.font, cfg.font_size, cfg.text_color)
 
         self.add(self.rect, self.label)
 
@@ -143,6 +109,7 @@ class PriorityQueue(VGroup):
         scene.play(Create(self.top_bar, run_time=0.5), Create(self.bottom_bar, run_time=0.5))
         scene.play(Write(initial_elements), run_time=0.5)
 
+    @instrumented("PriorityQueue.pq_add")
     def pq_add(self, scene: Scene, value: int, duration: Optional[float] = None):
         """Animates adding a new element with a smooth slide from the back."""
 
@@ -152,6 +119,7 @@ class PriorityQueue(VGroup):
 
         # 1. Determine the element's final sorted position
         insertion_index = bisect.bisect_left(self.data, value)
+        count("compares", len(self.data).bit_length())
         target_pos = self._get_element_position(insertion_index)
 
         # 2. Create the new element at the very back of the queue's capacity
@@ -168,18 +136,20 @@ class PriorityQueue(VGroup):
             self.elements[i].animate.move_to(self._get_element_position(i + 1))
             for i in range(insertion_index, len(self.elements))
         ]
+        count("shifts", len(shift_anims))
 
         # 4. Play all movement animations together for a single, smooth motion
-        scene.play(travel_anim, *shift_anims, run_time=run_time)
+        play_changed(scene, travel_anim, *shift_anims, run_time=run_time)
 
         # 5. Update internal data structures
         self.data.insert(insertion_index, value)
         self.elements.insert(insertion_index, new_element)
 
         # 6. Highlight and unhighlight the element in its final resting place
-        scene.play(new_element.get_highlight_anim(), run_time=self.cfg.highlight_duration)
-        scene.play(new_element.get_unhighlight_anim(), run_time=self.cfg.highlight_duration)
+        play_changed(scene, new_element.get_highlight_anim(), run_time=self.cfg.highlight_duration)
+        play_changed(scene, new_element.get_unhighlight_anim(), run_time=self.cfg.highlight_duration)
 
+    @instrumented("PriorityQueue.pq_rem")
     def pq_rem(self, scene : Scene, hang_duration: Optional[float] = None, duration: Optional[float] = None) -> Optional[int]:
         """Animates removing the front element, which exits from the front."""
         if not self.elements:
@@ -190,7 +160,7 @@ class PriorityQueue(VGroup):
         removed_data = self.data[0]
 
         # 1. Highlight the element that will be removed
-        scene.play(removed_element.get_highlight_anim(), run_time=self.cfg.highlight_duration)
+        play_changed(scene, removed_element.get_highlight_anim(), run_time=self.cfg.highlight_duration)
 
         # 2. Define the "hanging" position to the front-left of the queue
         hang_pos = self.top_bar.get_corner(UL) + LEFT * 0.75
@@ -201,16 +171,17 @@ class PriorityQueue(VGroup):
             self.elements[i].animate.move_to(self._get_element_position(i - 1))
             for i in range(1, len(self.elements))
         ]
+        count("shifts", len(shift_anims))
 
         # 4. Play animations: front element moves to hang position while others shift
-        scene.play(
+        play_changed(scene,
             removed_element.animate.move_to(hang_pos),
             *shift_anims,
             run_time=run_time
         )
 
         # 5. Unhighlight the element now that it has been removed
-        scene.play(removed_element.get_unhighlight_anim(), run_time=self.cfg.highlight_duration)
+        play_changed(scene, removed_element.get_unhighlight_anim(), run_time=self.cfg.highlight_duration)
 
         # 6. Update internal state
         self.data.pop(0)
@@ -225,7 +196,103 @@ class PriorityQueue(VGroup):
 
         return removed_data
 
+    @instrumented("PriorityQueue.pq_add_many")
+    def pq_add_many(self, scene: Scene, values: List[int], duration: Optional[float] = None):
+        """
+        Animates adding several elements at once: they fade in at the back, slide into their
+        sorted slots together while the existing elements shift, and are highlighted together.
+        """
+        if not values:
+            return
+        if len(self.elements) + len(values) > self.cfg.capacity:
+            scene.play(Write(Text("Queue is full!", color=RED).to_edge(UP)))
+            return
+
+        # 1. Sort the new values once and merge them with the queue, new values going before equal
+        #    ones as with bisect_left in pq_add
+        new_values = sorted(values)
+        k = len(new_values)
+        new_elements = []
+        for j, value in enumerate(new_values):
+            element = QueueElement(value, self.cfg)
+            element.move_to(self._get_element_position(self.cfg.capacity - k + j))
+            new_elements.append(element)
+        self.add(*new_elements)
+        scene.play(*[FadeIn(element) for element in new_elements], run_time=0.5)
+
+        merged_data, merged_elements = [], []
+        i = j = 0
+        while i < len(self.data) or j < k:
+            if j < k and (i == len(self.data) or new_values[j] <= self.data[i]):
+                merged_data.append(new_values[j])
+                merged_elements.append(new_elements[j])
+                j += 1
+            else:
+                merged_data.append(self.data[i])
+                merged_elements.append(self.elements[i])
+                i += 1
+
+        # 2. Move every element to its merged slot in one motion
+        run_time = duration if duration is not None else self.cfg.add_duration
+        play_changed(scene, *[
+            element.animate.move_to(self._get_element_position(index))
+            for index, element in enumerate(merged_elements)
+        ], run_time=run_time)
+        count("shifts", sum(1 for index, element in enumerate(self.elements) if merged_elements[index] is not element))
+
+        # 3. Update internal data structures
+        self.data = merged_data
+        self.elements = merged_elements
+
+        # 4. Highlight and unhighlight the new elements together
+        play_changed(scene, *[element.get_highlight_anim() for element in new_elements], run_time=self.cfg.highlight_duration)
+        play_changed(scene, *[element.get_unhighlight_anim() for element in new_elements], run_time=self.cfg.highlight_duration)
+
+    @instrumented("PriorityQueue.pq_rem_many")
+    def pq_rem_many(self, scene: Scene, n: int, hang_duration: Optional[float] = None, duration: Optional[float] = None) -> List[int]:
+        """Animates removing the `n` front elements at once. Returns their values, front first."""
+        if not self.elements:
+            scene.play(Write(Text("Queue is empty!", color=YELLOW).to_edge(UP)))
+            return []
+        n = min(n, len(self.elements))
+        if n <= 0:
+            return []
+
+        removed_elements = self.elements[:n]
+        removed_data = self.data[:n]
+
+        # 1. Highlight the elements that will be removed
+        play_changed(scene, *[element.get_highlight_anim() for element in removed_elements], run_time=self.cfg.highlight_duration)
+
+        # 2. Hang the removed elements in a row to the front-left, the front element nearest the queue,
+        #    while the remaining elements shift left by `n`
+        hang_pos = self.top_bar.get_corner(UL) + LEFT * 0.75
+        step = self.cfg.element_width + self.cfg.element_spacing
+        run_time = duration if duration is not None else self.cfg.remove_duration
+        play_changed(scene,
+            *[element.animate.move_to(hang_pos + LEFT * step * j) for j, element in enumerate(removed_elements)],
+            *[self.elements[i].animate.move_to(self._get_element_position(i - n)) for i in range(n, len(self.elements))],
+            run_time=run_time
+        )
+        count("shifts", len(self.elements) - n)
+
+        # 3. Unhighlight the elements now that they have been removed
+        play_changed(scene, *[element.get_unhighlight_anim() for element in removed_elements], run_time=self.cfg.highlight_duration)
+
+        # 4. Update internal state
+        self.data = self.data[n:]
+        self.elements = self.elements[n:]
+        self.remove(*removed_elements)
+
+        # 5. Wait for the hang duration, then fade out the removed elements
+        final_hang_duration = hang_duration if hang_duration is not None else self.cfg.default_hang_duration
+        if final_hang_duration > 0:
+            scene.wait(final_hang_duration)
+        scene.play(*[FadeOut(element) for element in removed_elements])
+
+        return removed_data
+
     def shift_to(self, scene : Scene, position: np.ndarray, duration: Optional[float] = None):
         """Animates the smooth translation of the entire Priority Queue to a new position."""
         run_time = duration if duration is not None else self.cfg.move_duration
-        scene.play(self.animate.move_to(position), run_time=run_time)
+        play_changed(scene, self.animate.move_to(position), run_time=run_time)
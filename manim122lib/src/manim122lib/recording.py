@@ -0,0 +1,84 @@
+from manim import *
+from manim.utils.family import extract_mobject_family_members
+from manim.utils.family_ops import restructure_list_to_exclude_certain_family_members
+from dataclasses import dataclass, field
+from typing import List
+from .timeline import apply_animations, describe_animations
+
+# --- Recording scene ---
+# A stand-in for Scene/Slide with no renderer or camera. play brings every animation to its
+# final state (the timeline dry run's apply_animations), so mobjects end up exactly where a
+# real render would leave them, and every play, wait, add and next_slide is recorded. The
+# library can then be exercised, tested and profiled at Python speed.
+
+
+@dataclass
+class SceneCall:
+    kind: str  # "play", "wait", "add" or "next_slide"
+    run_time: float = 0.0
+    animations: str = ""  # animation class names, for play
+    mobjects: List[Mobject] = field(default_factory=list)  # every family member it touched
+    notes: str = ""
+
+
+class RecordingScene:
+    """
+    Records scene calls instead of rendering them.
+
+        scene = RecordingScene()
+        heap = MinHeap([5, 3, 8], scene=scene)
+        heap.add_node(1, scene)
+        scene.plays, scene.time  # number of plays, seconds of animation
+    """
+    compile_animations = Scene.compile_animations
+    add_mobjects_from_animations = Scene.add_mobjects_from_animations
+
+    def __init__(self):
+        self.mobjects: List[Mobject] = []
+        self.foreground_mobjects: List[Mobject] = []
+        self.calls: List[SceneCall] = []
+        self.time = 0.0
+        # Adds and removes made by animations themselves are not recorded
+        self._playing = False
+
+    def get_mobject_family_members(self) -> List[Mobject]:
+        return extract_mobject_family_members(self.mobjects)
+
+    def add(self, *mobjects: Mobject) -> "RecordingScene":
+        self.remove(*mobjects)
+        self.mobjects += mobjects
+        if not self._playing:
+            self.calls.append(SceneCall("add", mobjects=extract_mobject_family_members(list(mobjects))))
+        return self
+
+    def remove(self, *mobjects: Mobject) -> "RecordingScene":
+        self.mobjects = restructure_list_to_exclude_certain_family_members(self.mobjects, list(mobjects))
+        return self
+
+    def play(self, *args, **kwargs):
+        self._playing = True
+        try:
+            animations = apply_animations(self, *args, **kwargs)
+        finally:
+            self._playing = False
+        if not animations: return
+        run_time = max(animation.run_time for animation in animations)
+        touched = extract_mobject_family_members([animation.mobject for animation in animations if animation.mobject is not None])
+        self.calls.append(SceneCall("play", run_time, describe_animations(animations), touched))
+        self.time += run_time
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, stop_condition=None, frozen_frame=None):
+        self.calls.append(SceneCall("wait", duration))
+        self.time += duration
+
+    def next_slide(self, *args, notes: str = "", **kwargs):
+        self.calls.append(SceneCall("next_slide", notes=notes))
+
+    next_section = next_slide
+
+    @property
+    def plays(self) -> int:
+        return sum(1 for call in self.calls if call.kind == "play")
+
+    def calls_of(self, kind: str) -> List[SceneCall]:
+        return [call for call in self.calls if call.kind == kind]
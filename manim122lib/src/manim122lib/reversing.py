@@ -0,0 +1,62 @@
+from pathlib import Path
+import json
+import platform
+from manim_slides.utils import reverse_video_file
+
+REVERSED_VIDEO_POLICIES = ("all", "none", "marked")
+
+
+class SelectiveReversing:
+    """
+    Mixin for manim_slides Slide classes that controls which slides get a reversed video.
+
+    Set `reversed_videos` on the deck class: "all" (manim-slides' default), "none" (every
+    rev_file points at the forward video, so nothing extra is encoded) or "marked" (only the
+    slides on which mark_reversible() was called get a reversed video). The slides JSON
+    always has a valid rev_file for every slide.
+
+        class PC13(SelectiveReversing, Slide):
+            reversed_videos = "none"
+    """
+    reversed_videos: str = "all"
+
+    def mark_reversible(self):
+        """Marks the slide in progress as needing a reversed video under reversed_videos = "marked"."""
+        if not hasattr(self, "_reversible_slides"): self._reversible_slides = set()
+        self._reversible_slides.add(len(self._slides))
+
+    def _save_slides(self, use_cache: bool = True, flush_cache: bool = False, skip_reversing: bool = False):
+        if self.reversed_videos not in REVERSED_VIDEO_POLICIES:
+            raise ValueError(f"reversed_videos must be one of {REVERSED_VIDEO_POLICIES}, not {self.reversed_videos!r}.")
+        if self.reversed_videos == "all" or skip_reversing:
+            return super()._save_slides(use_cache=use_cache, flush_cache=flush_cache, skip_reversing=skip_reversing)
+
+        self._add_last_slide()
+        marked = []
+        if self.reversed_videos == "marked":
+            marked = [self._slides[i] for i in sorted(getattr(self, "_reversible_slides", ())) if i < len(self._slides)]
+        super()._save_slides(use_cache=use_cache, flush_cache=flush_cache, skip_reversing=True)
+        if not marked:
+            return
+
+        # Only slides without skip_animations are written, in order
+        saved = [slide for slide in self._slides if not slide.skip_animations]
+        slides_path = self._output_folder / f"{self}.json"
+        presentation = json.loads(slides_path.read_text())
+        for slide in marked:
+            index = next((j for j, other in enumerate(saved) if other is slide), None)
+            if index is None: continue
+            entry = presentation["slides"][index]
+            file = Path(entry["file"])
+            rev_file = file.with_name(f"{file.stem}_reversed{file.suffix}")
+            if not use_cache or not rev_file.exists():
+                reverse_video_file(
+                    file, rev_file,
+                    max_segment_duration=self.max_duration_before_split_reverse,
+                    num_processes=self.num_processes,
+                    leave=self._leave_progress_bar,
+                    ascii=True if platform.system() == "Windows" else None,
+                    disable=not self._show_progress_bar,
+                )
+            entry["rev_file"] = str(rev_file)
+        slides_path.write_text(json.dumps(presentation, indent=2))
@@ -0,0 +1,177 @@
+from manim import *
+from dataclasses import dataclass, field, asdict
+from typing import List, Optional, Type
+import argparse
+import importlib.util
+import json
+import sys
+
+# --- Timeline dry run ---
+# Runs a Scene/Slide's construct with play, wait and next_slide replaced: every animation
+# jumps straight to its final state (begin + finish, as manim does for skipped animations)
+# and only its run_time is recorded, so no frame is rasterized and nothing is written.
+
+
+@dataclass
+class TimelineEvent:
+    kind: str  # "play" or "wait"
+    run_time: float
+    description: str = ""
+
+
+@dataclass
+class SlideTimeline:
+    index: int
+    events: List[TimelineEvent] = field(default_factory=list)
+    notes: str = ""
+    skipped: bool = False  # next_slide(skip_animations=True): manim_slides does not save it
+
+    @property
+    def duration(self) -> float:
+        return sum(event.run_time for event in self.events)
+
+    @property
+    def plays(self) -> int:
+        return sum(1 for event in self.events if event.kind == "play")
+
+    @property
+    def waits(self) -> int:
+        return sum(1 for event in self.events if event.kind == "wait")
+
+
+@dataclass
+class DeckTimeline:
+    scene_name: str
+    slides: List[SlideTimeline] = field(default_factory=list)
+
+    @property
+    def duration(self) -> float:
+        return sum(slide.duration for slide in self.slides)
+
+    @property
+    def plays(self) -> int:
+        return sum(slide.plays for slide in self.slides)
+
+    def report(self) -> str:
+        """A per-slide pacing table."""
+        lines = [
+            f"{self.scene_name}: {len(self.slides)} slides, {self.plays} plays, {self.duration:.2f} s",
+            f"{'Slide':>5}  {'Plays':>5}  {'Waits':>5}  {'Duration':>10}",
+        ]
+        for slide in self.slides:
+            line = f"{slide.index:>5}  {slide.plays:>5}  {slide.waits:>5}  {slide.duration:>8.2f} s"
+            if slide.skipped: line += "  (skipped)"
+            if slide.notes: line += f"  {slide.notes.splitlines()[0]}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "scene": self.scene_name,
+            "duration": self.duration,
+            "plays": self.plays,
+            "slides": [{**asdict(slide), "duration": slide.duration, "plays": slide.plays} for slide in self.slides],
+        }
+
+
+def describe_animations(animations: List[Animation]) -> str:
+    return ", ".join(type(anim).__name__ for anim in animations)
+
+
+def apply_animations(scene: Scene, *args, **kwargs) -> List[Animation]:
+    """Brings every animation of a scene.play(...) call to its final state without rendering. Returns the compiled animations."""
+    for key in ("subcaption", "subcaption_duration", "subcaption_offset"):
+        kwargs.pop(key, None)
+    animations = scene.compile_animations(*args, **kwargs)
+    scene.add_mobjects_from_animations(animations)
+    for animation in animations:
+        animation._setup_scene(scene)
+        animation.begin()
+    for animation in animations:
+        animation.finish()
+        animation.clean_up_from_scene(scene)
+    return animations
+
+
+class TimelineRecorder:
+    """
+    Replaces play, wait and next_slide on one scene instance with recording versions.
+
+    Slide boundaries follow manim_slides: next_slide only closes the current slide if
+    something was played since the previous boundary.
+    """
+    def __init__(self, scene: Scene):
+        self.scene = scene
+        self.timeline = DeckTimeline(type(scene).__name__)
+        self.current = SlideTimeline(1)
+        # Seconds recorded so far; the scene's renderer is only read, never advanced
+        self.time = 0.0
+
+    def attach(self) -> "TimelineRecorder":
+        self.scene.play = self.play
+        self.scene.wait = self.wait
+        self.scene.next_slide = self.next_slide
+        self.scene.next_section = self.next_slide
+        return self
+
+    def record(self, kind: str, run_time: float, description: str = ""):
+        self.current.events.append(TimelineEvent(kind, float(run_time), description))
+        self.time += run_time
+
+    def play(self, *args, **kwargs):
+        animations = apply_animations(self.scene, *args, **kwargs)
+        if animations:
+            self.record("play", max(animation.run_time for animation in animations), describe_animations(animations))
+
+    def wait(self, duration: float = DEFAULT_WAIT_TIME, stop_condition=None, frozen_frame: Optional[bool] = None):
+        self.record("wait", duration)
+
+    def next_slide(self, *args, notes: str = "", skip_animations: bool = False, **kwargs):
+        if self.current.events:
+            wait_time = getattr(self.scene, "wait_time_between_slides", 0.0)
+            if wait_time > 0: self.wait(wait_time)
+            self.timeline.slides.append(self.current)
+            self.current = SlideTimeline(self.current.index + 1)
+        self.current.notes = notes
+        self.current.skipped = skip_animations or getattr(self.scene, "_skip_animations", False)
+
+    def finish(self) -> DeckTimeline:
+        if self.current.events:
+            self.timeline.slides.append(self.current)
+            self.current = SlideTimeline(self.current.index + 1)
+        return self.timeline
+
+
+def dry_run(scene_cls: Type[Scene]) -> DeckTimeline:
+    """Runs scene_cls's construct without rendering and returns its per-slide timeline."""
+    with tempconfig({"dry_run": True, "write_to_movie": False, "disable_caching": True}):
+        scene = scene_cls()
+        recorder = TimelineRecorder(scene).attach()
+        scene.setup()
+        scene.construct()
+        scene.tear_down()
+    return recorder.finish()
+
+
+def load_scene_class(path: str, name: str) -> Type[Scene]:
+    """Imports the scene file at `path` and returns its class `name`."""
+    spec = importlib.util.spec_from_file_location(f"_timeline_{name.lower()}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    if not hasattr(module, name): raise ValueError(f"No scene named {name!r} in {path}.")
+    return getattr(module, name)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Print per-slide durations and play counts of a deck without rendering it.")
+    parser.add_argument("file", help="Scene file, e.g. pc13/main.py")
+    parser.add_argument("scene", help="Scene or Slide class name, e.g. PC13")
+    parser.add_argument("--json", action="store_true", help="Print the timeline as JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    timeline = dry_run(load_scene_class(args.file, args.scene))
+    print(json.dumps(timeline.to_dict(), indent=2) if args.json else timeline.report())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+import argparse
+import json
+import re
+import shutil
+import subprocess
+import sys
+from .publish import ContentStore
+
+# --- Web transcode and resolution ladder ---
+# manim writes mp4s with the moov atom at the end, so browsers can't start playing until
+# they have the whole file. They also come out at a single resolution. transcode()
+# re-encodes every video the HTML references into a 480p/720p/1080p ladder (never above the
+# source) with +faststart. Each rung is capped CRF: x264 spends bits by content, so static
+# text slides come out tiny, and maxrate caps busy ones. Rungs are encoded into a scratch
+# folder and then moved into the deck's content store (see publish.py), so identical rungs
+# are stored once. The HTML is pointed at the top rung. variants.json lists every rung so
+# the player can pick one (see preload.py).
+
+LADDER = (480, 720, 1080)
+VARIANTS_FILE = "variants.json"
+# Scratch folder in the deck for rungs being encoded; emptied into the store as they finish
+BUILD_DIR = ".transcode"
+# Rung height -> (crf, maxrate in kbit/s)
+RUNGS: Dict[int, tuple] = {480: (28, 1000), 720: (26, 2500), 1080: (24, 5000)}
+_SECTION_VIDEO = re.compile(r'(<section\b[^>]*?data-background-video=")([^"]+)(")', re.S)
+
+
+def _require(tool: str) -> str:
+    path = shutil.which(tool)
+    if path is None:
+        raise FileNotFoundError(f"{tool} was not found on PATH; install ffmpeg to transcode slide videos.")
+    return path
+
+
+def video_height(path: Path) -> int:
+    """Height in pixels of the first video stream, via ffprobe."""
+    out = subprocess.run(
+        [_require("ffprobe"), "-v", "error", "-select_streams", "v:0", "-show_entries", "stream=height", "-of", "json", str(path)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return int(json.loads(out)["streams"][0]["height"])
+
+
+def encode_rung(src: Path, dst: Path, height: int):
+    """Encodes src at the given height with that rung's capped CRF and the moov atom up front."""
+    crf, maxrate = RUNGS.get(height, RUNGS[min(RUNGS, key=lambda rung: abs(rung - height))])
+    subprocess.run([
+        _require("ffmpeg"), "-y", "-v", "error", "-i", str(src),
+        "-map", "0:v:0", "-map", "0:a?",
+        "-vf", f"scale=-2:{height}",
+        "-c:v", "libx264", "-preset", "slow", "-tune", "animation", "-pix_fmt", "yuv420p",
+        "-crf", str(crf), "-maxrate", f"{maxrate}k", "-bufsize", f"{2 * maxrate}k",
+        "-c:a", "aac", "-b:a", "128k",
+        "-movflags", "+faststart",
+        str(dst),
+    ], check=True)
+
+
+def transcode_video(deck_dir: Path, ref: str, store: ContentStore, ladder: Sequence[int] = LADDER) -> List[dict]:
+    """Encodes the ladder for the deck-relative video `ref` into store. Returns its variants, lowest first."""
+    src = deck_dir / ref
+    source_height = video_height(src)
+    heights = sorted(h for h in ladder if h <= source_height) or [source_height]
+    build_dir = deck_dir / BUILD_DIR
+    build_dir.mkdir(exist_ok=True)
+    variants = []
+    for height in heights:
+        # Named after the whole ref, so videos with the same name in different folders can be encoded at once
+        dst = build_dir / f"{Path(ref).with_suffix('').as_posix().replace('/', '_')}_{height}p.mp4"
+        encode_rung(src, dst, height)
+        stored = store.add(dst.relative_to(deck_dir).as_posix())
+        variants.append({"height": height, "src": stored, "bytes": (deck_dir / stored).stat().st_size})
+    return variants
+
+
+def transcode(deck_dir: Path, html_name: str = "slides.html", ladder: Sequence[int] = LADDER, workers: Optional[int] = None, force: bool = False) -> Dict[str, dict]:
+    """
+    Transcodes every slide video referenced by deck_dir/html_name into the content store, points
+    the HTML at the top rung and writes deck_dir/variants.json. Already transcoded videos are
+    skipped unless force.
+    """
+    store = ContentStore(deck_dir)
+    html_path = deck_dir / html_name
+    variants_path = deck_dir / VARIANTS_FILE
+    known: Dict[str, dict] = json.loads(variants_path.read_text()) if variants_path.exists() else {}
+    html = html_path.read_text()
+
+    # The HTML may already point at a top rung from an earlier run
+    def source_of(ref: str) -> str:
+        return known[ref]["source"] if ref in known else ref
+
+    previous = {entry["source"]: entry["variants"] for entry in known.values()}
+
+    def ladder_of(source: str) -> List[dict]:
+        rungs = previous.get(source)
+        if not force and rungs and all((deck_dir / rung["src"]).exists() for rung in rungs):
+            return rungs
+        return transcode_video(deck_dir, source, store, ladder)
+
+    unique = list(dict.fromkeys(source_of(m.group(2)) for m in _SECTION_VIDEO.finditer(html)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        ladders = dict(zip(unique, pool.map(ladder_of, unique)))
+
+    variants = {}
+    for source, rungs in ladders.items():
+        variants[rungs[-1]["src"]] = {"source": source, "variants": rungs}
+    top = {source: rungs[-1]["src"] for source, rungs in ladders.items()}
+    html = _SECTION_VIDEO.sub(lambda m: m.group(1) + top[source_of(m.group(2))] + m.group(3), html)
+    html_path.write_text(html)
+    variants_path.write_text(json.dumps(variants, indent=2, sort_keys=True))
+    store.save()
+    if (deck_dir / BUILD_DIR).is_dir() and not any((deck_dir / BUILD_DIR).iterdir()):
+        (deck_dir / BUILD_DIR).rmdir()
+    return variants
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Re-encode a converted deck's videos for the web: faststart, capped CRF and a resolution ladder.")
+    parser.add_argument("deck", help="Precept folder, e.g. pc13")
+    parser.add_argument("--html", default="slides.html", help="HTML file to rewrite (default: slides.html)")
+    parser.add_argument("--ladder", type=int, nargs="+", default=list(LADDER), help="Rung heights in pixels (default: 480 720 1080)")
+    parser.add_argument("--workers", type=int, help="Number of videos encoded at once (default: ThreadPoolExecutor's default)")
+    parser.add_argument("--force", action="store_true", help="Re-encode videos that already have variants")
+    args = parser.parse_args(argv)
+
+    deck_dir = Path(args.deck)
+    variants = transcode(deck_dir, args.html, ladder=args.ladder, workers=args.workers, force=args.force)
+    before = sum((deck_dir / entry["source"]).stat().st_size for entry in variants.values() if (deck_dir / entry["source"]).exists())
+    after = sum(entry["variants"][-1]["bytes"] for entry in variants.values())
+    print(f"{deck_dir}: {len(variants)} videos transcoded; top rung {after / 1e6:.1f} MB (sources {before / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
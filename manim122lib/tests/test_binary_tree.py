@@ -0,0 +1,206 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+from manim import tempconfig
+from manim122lib.binary_tree import MinHeap, BinaryTreeNode, CollapsedNode
+from manim122lib.configs import BinaryTreeConfig
+from manim122lib.heap_core import HeapCore
+from manim122lib.recording import RecordingScene
+
+DATA = [9, 4, 7, 1, 8, 2, 6, 3, 5]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def media_dir(tmp_path_factory):
+    # Text labels are rendered to SVG files under the media dir
+    with tempconfig({"media_dir": str(tmp_path_factory.mktemp("media"))}):
+        yield
+
+
+def build(data=DATA, **kwargs):
+    scene = RecordingScene()
+    heap = MinHeap(data, limit=15, scene=scene, debug=True, **kwargs)
+    return scene, heap
+
+
+def run_ops(scene, heap):
+    """Adds a new minimum, then removes the root and a middle slot. debug checks the heap after each."""
+    heap.add_node(0, scene)
+    heap.remove_node(1, scene)
+    heap.add_node(10, scene)
+    heap.remove_node(2, scene)
+    return heap.keys[1:heap.len + 1].tolist()
+
+
+def calls_during(scene, operation, *args):
+    start = len(scene.calls)
+    operation(*args, scene)
+    return scene.calls[start:]
+
+
+# --- Coalesced heapify ---
+def test_coalesced_heapify_leaves_the_same_heap():
+    assert run_ops(*build(coalesce_heapify=True)) == run_ops(*build())
+
+
+def test_coalesced_sift_path_is_one_play_of_the_same_length():
+    scene, heap = build()
+    stepwise = calls_during(scene, heap.add_node, 0)
+    scene, heap = build(coalesce_heapify=True)
+    coalesced = calls_during(scene, heap.add_node, 0)
+
+    # Node and cell, edge, the whole sift-up path, reposition
+    assert [call.kind for call in coalesced] == ["play", "play", "play", "wait"]
+    assert coalesced[2].animations == "Succession"
+    assert len(stepwise) > len(coalesced)
+    assert sum(call.run_time for call in coalesced) == pytest.approx(sum(call.run_time for call in stepwise))
+
+
+# --- Bulk build ---
+def floyd(data):
+    core = HeapCore()
+    core.heapify(data)
+    return core.keys[1:]
+
+
+@pytest.mark.parametrize("animate_build", [True, False])
+def test_bulk_build_matches_bottom_up_heapify(animate_build):
+    scene, heap = build(bulk_build=True, animate_build=animate_build)
+    assert heap.keys[1:heap.len + 1].tolist() == floyd(DATA)
+    assert [heap.nodes[i].data for i in range(1, heap.len + 1)] == floyd(DATA)
+
+
+def test_bulk_build_plays_one_creation_and_one_play_per_level():
+    scene, heap = build(bulk_build=True)
+    plays = scene.calls_of("play")
+    assert plays[0].animations.startswith("Create")
+    # Three levels have parents, and the bottom one (slot 4) needs no swap
+    assert [call.animations for call in plays[1:]] == ["Succession", "Succession"]
+
+
+def test_unanimated_bulk_build_makes_no_plays():
+    scene, heap = build(bulk_build=True, animate_build=False)
+    assert scene.plays == 0
+    assert sorted(run_ops(scene, heap)) == sorted(run_ops(*build()))
+
+
+def test_bulk_build_without_a_scene():
+    heap = MinHeap(DATA, limit=15, bulk_build=True, debug=True)
+    assert heap.keys[1:heap.len + 1].tolist() == floyd(DATA)
+
+
+# --- Array window ---
+@pytest.mark.parametrize("options", [{}, {"coalesce_heapify": True}, {"bulk_build": True}], ids=["stepwise", "coalesced", "bulk"])
+def test_windowed_heap_runs_like_the_full_array(options):
+    assert run_ops(*build(cfg=BinaryTreeConfig(array_window=4), **options)) == run_ops(*build(**options))
+
+
+def test_coalesced_sift_plays_window_slides_between_its_steps():
+    scene, heap = build(cfg=BinaryTreeConfig(array_window=4), coalesce_heapify=True)
+    plays = [call.animations.split(",")[0] for call in calls_during(scene, heap.add_node, 0) if call.kind == "play"]
+    # 0 climbs 10 -> 5 -> 2 -> 1, leaving the 4-cell window before each swap
+    assert plays[2:] == ["Succession", "FadeOut", "Succession", "FadeOut", "Succession", "FadeOut", "Succession"]
+
+
+def test_off_window_cells_have_no_animations():
+    scene, heap = build(cfg=BinaryTreeConfig(array_window=4))
+    array = heap.array_vis
+    assert not array.in_window(1, 2)
+    assert array.highlight_cell_animated(1) is None
+    assert array.unhighlight_cell_animated(1) is None
+    assert array.swap_cells_animated(1, 2, move_window=False) is None
+    assert (array.values[1], array.values[2]) == (heap.nodes[2].data, heap.nodes[1].data)
+    assert not array.in_window(1, 2)
+
+
+# --- Compact layout and level of detail ---
+@pytest.mark.parametrize("options", [{}, {"coalesce_heapify": True}, {"bulk_build": True}], ids=["stepwise", "coalesced", "bulk"])
+def test_collapsed_levels_run_like_the_full_tree(options):
+    assert run_ops(*build(cfg=BinaryTreeConfig(lod_depth=2), **options)) == run_ops(*build(**options))
+
+
+def test_compact_collapsed_windowed_coalesced_heap():
+    cfg = BinaryTreeConfig(layout="compact", lod_depth=2, array_window=4)
+    assert run_ops(*build(cfg=cfg, coalesce_heapify=True)) == run_ops(*build(coalesce_heapify=True))
+
+
+def test_collapsed_nodes_have_no_animations():
+    scene, heap = build(cfg=BinaryTreeConfig(lod_depth=2))
+    assert isinstance(heap.nodes[4], CollapsedNode)
+    assert heap.nodes[4].get_highlight_anim(deferred=True) is None
+    assert heap.nodes[4].get_unhighlight_anim() is None
+    # Both slots are collapsed, so only the array cells swap
+    assert len(heap._swap_anims(8, 9)) == 1
+
+
+def test_level_of_detail_bounds_the_node_count():
+    heap = MinHeap(list(range(60, 0, -1)), limit=63, cfg=BinaryTreeConfig(lod_depth=2), debug=True)
+    assert sum(isinstance(node, BinaryTreeNode) for node in heap.nodes) == 3
+    assert {root: summary.count for root, summary in heap.summaries.items()} == {4: 15, 5: 15, 6: 15, 7: 12}
+
+
+def test_compact_layout_fits_the_layout_width():
+    classic = MinHeap(limit=63)._get_positions()
+    compact = MinHeap(limit=63, cfg=BinaryTreeConfig(layout="compact", layout_width=6))._get_positions()
+    assert np.ptp(classic[1:, 0]) > 6
+    assert np.ptp(compact[1:, 0]) <= 6
+    assert np.allclose(compact[1:, 1], classic[1:, 1])
+
+
+# --- Keys and priority ---
+@pytest.mark.parametrize("options", [{}, {"coalesce_heapify": True}, {"bulk_build": True}], ids=["stepwise", "coalesced", "bulk"])
+def test_has_higher_priority_orders_the_heap(options):
+    scene, heap = build(has_higher_priority=lambda a, b: a > b, **options)
+    assert heap.keys[1] == max(DATA)
+    heap.add_node(20, scene)
+    assert heap.keys[1] == 20
+    heap.remove_node(1, scene)
+    assert heap.keys[1] == max(DATA)
+    assert heap.to_core().is_valid()
+
+
+def test_keys_widen_to_the_values_added():
+    scene, heap = build()
+    assert heap.keys.dtype == np.int64
+    heap.add_node(0.5, scene)
+    assert heap.keys.dtype == np.float64 and heap.keys[1] == 0.5
+    heap.add_node(2**70, scene)
+    assert heap.keys.dtype == object
+    assert sorted(heap.keys[1:heap.len + 1]) == sorted([*DATA, 0.5, 2**70])
+
+
+# --- Invariants ---
+@pytest.mark.parametrize("options", [{}, {"coalesce_heapify": True}], ids=["stepwise", "coalesced"])
+def test_removing_from_the_middle_can_sift_up(options):
+    # The last value, 4, lands under 10 in slot 5 and has to climb
+    scene, heap = build([1, 10, 2, 11, 12, 3, 4], bulk_build=True, **options)
+    heap.remove_node(5, scene)
+    assert heap.keys[1:heap.len + 1].tolist() == [1, 4, 2, 11, 10, 3]
+
+
+def test_check_invariants_catches_a_broken_heap():
+    scene, heap = build()
+    heap.check_invariants()
+    heap.keys[1], heap.keys[2] = heap.keys[2], heap.keys[1]
+    with pytest.raises(AssertionError, match="order"):
+        heap.check_invariants()
+    heap.keys[1], heap.keys[2] = heap.keys[2], heap.keys[1]
+
+    heap.array_vis.values[3] = -1
+    with pytest.raises(AssertionError, match="array cell"):
+        heap.check_invariants()
+    heap.array_vis.values[3] = heap.nodes[3].data
+
+    heap.nodes[2].shift([1, 0, 0])
+    with pytest.raises(AssertionError, match="slot 2"):
+        heap.check_invariants()
+
+
+def test_debug_checks_after_every_operation(monkeypatch):
+    scene, heap = build()
+    checks = []
+    monkeypatch.setattr(heap, "check_invariants", lambda: checks.append(heap.len))
+    heap.add_node(0, scene)
+    heap.remove_node(1, scene)
+    assert checks == [len(DATA) + 1, len(DATA)]
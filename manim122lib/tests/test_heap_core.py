@@ -0,0 +1,84 @@
+import random
+import numpy as np
+import pytest
+from manim122lib.heap_core import HeapCore, heapify_order, COMPARE, SWAP, FILL, EMPTY, REPOSITION
+
+
+def test_insert_and_pop_return_values_in_order():
+    values = random.Random(1).sample(range(100), 30)
+    core = HeapCore(values)
+    assert core.is_valid()
+    assert [core.pop() for _ in range(len(values))] == sorted(values)
+    assert len(core) == 0
+
+
+def test_insert_records_fill_compares_swaps_and_reposition():
+    core = HeapCore([5, 8])
+    core.take_trace()
+    assert core.insert(3) == 1
+    assert core.take_trace() == [(FILL, 3, 3), (COMPARE, 3, 1), (SWAP, 3, 1), (REPOSITION,)]
+    assert core.trace == []
+
+
+def test_remove_sifts_the_last_value_into_place():
+    core = HeapCore([1, 4, 2, 7, 5])
+    core.take_trace()
+    assert core.remove() == 1
+    trace = core.take_trace()
+    assert trace[:2] == [(SWAP, 1, 5), (EMPTY, 5, 1)]
+    assert core.keys[1:] == [2, 4, 5, 7]
+
+
+def test_remove_from_the_middle_can_sift_up():
+    core = HeapCore()
+    core.heapify([1, 10, 2, 11, 12, 3, 4])
+    assert core.remove(5) == 12
+    assert core.is_valid()
+    assert sorted(core.keys[1:]) == [1, 2, 3, 4, 10, 11]
+
+
+def test_limits_and_empty_heap_raise():
+    core = HeapCore(limit=2)
+    core.insert(1)
+    core.insert(2)
+    with pytest.raises(ValueError):
+        core.insert(3)
+    with pytest.raises(ValueError):
+        HeapCore(limit=2).heapify([1, 2, 3])
+    with pytest.raises(IndexError):
+        HeapCore().peek()
+    with pytest.raises(IndexError):
+        HeapCore([1]).remove(2)
+
+
+def test_record_false_keeps_no_trace_but_counts():
+    core = HeapCore([3, 2, 1], record=False)
+    assert core.trace == []
+    assert core.compares > 0 and core.swaps > 0
+
+
+def test_has_higher_priority_makes_a_max_heap():
+    core = HeapCore([3, 9, 1, 7], has_higher_priority=lambda a, b: a > b)
+    assert core.peek() == 9
+    assert [core.pop() for _ in range(4)] == [9, 7, 3, 1]
+
+
+def test_heapify_is_floyd_bottom_up():
+    core = HeapCore()
+    core.heapify([5, 3, 1])
+    assert core.keys[1:] == [1, 3, 5]
+    assert core.trace[:3] == [(FILL, 1, 5), (FILL, 2, 3), (FILL, 3, 1)]
+    assert core.trace[-1] == (REPOSITION,)
+
+
+@pytest.mark.parametrize("size", [0, 1, 2, 3, 10, 31, 100])
+def test_heapify_order_matches_heapcore_heapify(size):
+    rng = random.Random(size)
+    values = [rng.randint(0, 20) for _ in range(size)]
+    keys = np.array([0] + values)
+    order = heapify_order(keys)
+    assert order[0] == 0
+    assert sorted(order[1:]) == list(range(1, size + 1))
+    core = HeapCore()
+    core.heapify(values)
+    assert list(keys[order][1:]) == core.keys[1:]
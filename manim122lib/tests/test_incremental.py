@@ -0,0 +1,93 @@
+import json
+from types import SimpleNamespace
+import pytest
+
+pytest.importorskip("manim")
+from manim122lib import incremental
+
+
+class Deck:
+    pass
+
+
+class FakeDeck:
+    """Stands in for the dry run and the real render: every segment renders to <fingerprint>_<n>.mp4."""
+    def __init__(self, monkeypatch, folder):
+        self.folder = folder
+        self.fingerprints = []
+        self.skipped = set()
+        self.renders = []
+        monkeypatch.setattr(incremental, "fingerprint_deck", self.fingerprint_deck)
+        monkeypatch.setattr(incremental, "render_segments", self.render_segments)
+
+    def fingerprint_deck(self, scene_cls, deck_dir):
+        slides = [SimpleNamespace(skipped=i in self.skipped) for i in range(len(self.fingerprints))]
+        return SimpleNamespace(timeline=SimpleNamespace(slides=slides), fingerprints=list(self.fingerprints), plan=[], library="lib")
+
+    def render_segments(self, scene_cls, plan, render):
+        self.renders.append(list(render))
+        entries = []
+        for fingerprint, rendered in zip(self.fingerprints, render):
+            if not rendered: continue
+            video = self.folder / "files" / f"{fingerprint}_{len(self.renders)}.mp4"
+            video.parent.mkdir(parents=True, exist_ok=True)
+            video.write_bytes(b"video")
+            entries.append({"file": str(video), "rev_file": str(video)})
+        (self.folder / "Deck.json").write_text(json.dumps({"resolution": [1920, 1080], "slides": entries}))
+
+    def build(self, **kwargs):
+        incremental.build(Deck, self.folder.parent, output_folder=self.folder, **kwargs)
+        return [entry["file"] for entry in json.loads((self.folder / "Deck.json").read_text())["slides"]]
+
+
+@pytest.fixture
+def deck(monkeypatch, tmp_path):
+    return FakeDeck(monkeypatch, tmp_path / "slides")
+
+
+def test_only_changed_segments_are_rendered_and_stitched_in_order(deck):
+    deck.fingerprints = ["a", "b", "c"]
+    first = deck.build()
+    assert deck.renders == [[True, True, True]]
+
+    deck.fingerprints = ["a", "B", "c"]
+    second = deck.build()
+    assert deck.renders[-1] == [False, True, False]
+    assert second == [first[0], str(deck.folder / "files" / "B_2.mp4"), first[2]]
+    manifest = json.loads((deck.folder / incremental.MANIFEST_DIR / "Deck.json").read_text())
+    assert manifest["library"] == "lib"
+    assert [manifest["segments"][fp]["file"] for fp in ("a", "B", "c")] == second
+
+
+def test_unchanged_deck_renders_nothing(deck):
+    deck.fingerprints = ["a", "b"]
+    first = deck.build()
+    assert deck.build() == first
+    assert len(deck.renders) == 1
+
+
+def test_cached_segment_whose_video_is_gone_is_rendered_again(deck):
+    deck.fingerprints = ["a", "b"]
+    first = deck.build()
+    (deck.folder / "files" / "b_1.mp4").unlink()
+    assert deck.build() == [first[0], str(deck.folder / "files" / "b_2.mp4")]
+    assert deck.renders[-1] == [False, True]
+
+
+def test_force_and_skipped_segments(deck):
+    deck.fingerprints = ["a", "b", "c"]
+    deck.skipped = {1}
+    files = deck.build()
+    assert deck.renders == [[True, False, True]]
+    assert files == [str(deck.folder / "files" / name) for name in ("a_1.mp4", "c_1.mp4")]
+    deck.build(force=True)
+    assert deck.renders[-1] == [True, False, True]
+
+
+def test_render_with_an_unexpected_slide_count_raises(deck, monkeypatch):
+    deck.fingerprints = ["a", "b"]
+    deck.build()
+    deck.fingerprints = ["a", "B"]
+    monkeypatch.setattr(incremental, "render_segments", lambda *args: (deck.folder / "Deck.json").write_text(json.dumps({"slides": []})))
+    with pytest.raises(ValueError):
+        deck.build()
@@ -0,0 +1,67 @@
+import json
+import pytest
+
+# enable() counts mobjects by wrapping manim's Mobject
+pytest.importorskip("manim")
+from manim122lib import instrument
+from manim122lib.instrument import ListSink, count, instrumented, instrumented_run
+
+
+class FakeScene:
+    def play(self, *args, **kwargs):
+        pass
+
+    def wait(self, *args, **kwargs):
+        self.play()
+
+
+@instrumented("inner")
+def inner(scene):
+    count("swaps", 2)
+    scene.play()
+
+
+@instrumented("outer")
+def outer(value, scene):
+    count("compares")
+    inner(scene)
+    scene.wait()
+
+
+def test_nothing_is_recorded_unless_enabled():
+    assert instrument._sink is None
+    outer(1, FakeScene())
+
+
+def test_nested_operations_count_toward_their_callers():
+    scene = FakeScene()
+    with instrumented_run(ListSink()) as records:
+        outer(1, scene=scene)
+    assert [(record["op"], record["parent"]) for record in records] == [("inner", "outer"), ("outer", None)]
+    assert {key: records[1][key] for key in ("plays", "waits", "compares", "swaps")} == {"plays": 1, "waits": 1, "compares": 1, "swaps": 2}
+    # The scene's methods are restored and tracing is off again
+    assert "play" not in scene.__dict__ and instrument._sink is None
+
+
+def test_summarize_command(tmp_path, capsys):
+    trace = tmp_path / "trace.jsonl"
+    with instrumented_run(ListSink()) as records:
+        outer(1, FakeScene())
+    trace.write_text("".join(json.dumps(record) + "\n" for record in records))
+    instrument.main(["summarize", str(trace)])
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("Operation") and {line.split()[0] for line in lines[1:]} == {"inner", "outer"}
+
+
+def test_record_command_traces_one_render(tmp_path, monkeypatch):
+    from manim122lib import timeline
+
+    class Deck(FakeScene):
+        def render(self):
+            outer(1, self)
+
+    monkeypatch.setattr(timeline, "load_scene_class", lambda path, name: Deck)
+    trace = tmp_path / "trace.jsonl"
+    instrument.main(["record", str(trace), "main.py", "Deck"])
+    assert [json.loads(line)["op"] for line in trace.read_text().splitlines()] == ["inner", "outer"]
+    assert instrument._sink is None
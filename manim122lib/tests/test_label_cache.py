@@ -0,0 +1,62 @@
+import pytest
+
+manim = pytest.importorskip("manim")
+from manim122lib.label_cache import LabelCache, cached_text
+
+
+def get(cache, text):
+    return cache.get(text, "", 24, manim.WHITE)
+
+
+def test_repeated_labels_are_rendered_once_and_copied():
+    cache = LabelCache()
+    first, second = get(cache, 7), get(cache, "7")
+    assert (cache.misses, cache.hits) == (1, 1)
+    assert first is not second
+    assert first.original_text == second.original_text == "7"
+
+
+def test_changing_a_label_leaves_the_cached_one_untouched():
+    cache = LabelCache()
+    get(cache, 3).set_color(manim.RED)
+    assert get(cache, 3).get_color().to_hex() == manim.WHITE.to_hex()
+
+
+def test_least_recently_used_label_is_evicted():
+    cache = LabelCache(max_size=2)
+    get(cache, 1)
+    get(cache, 2)
+    get(cache, 1)
+    get(cache, 3)
+    assert len(cache) == 2
+    misses = cache.misses
+    get(cache, 1)
+    assert cache.misses == misses
+    get(cache, 2)
+    assert cache.misses == misses + 1
+
+
+def test_max_size_zero_disables_caching():
+    cache = LabelCache(max_size=0)
+    get(cache, 1)
+    get(cache, 1)
+    assert len(cache) == 0 and cache.misses == 2
+
+
+def test_clear_resets_labels_and_counters():
+    cache = LabelCache()
+    get(cache, 1)
+    get(cache, 1)
+    cache.clear()
+    assert cache.stats() == {"size": 0, "max_size": 512, "hits": 0, "misses": 0}
+
+
+def test_package_exports_the_shared_instance():
+    import manim122lib
+    import manim122lib.label_cache
+    from manim122lib import label_cache
+    assert label_cache is manim122lib.label_cache
+    assert isinstance(label_cache, LabelCache)
+    misses = label_cache.misses
+    cached_text("label-cache-test", "", 24, manim.WHITE)
+    assert label_cache.misses == misses + 1
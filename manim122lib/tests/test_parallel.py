@@ -0,0 +1,78 @@
+import json
+import pytest
+
+pytest.importorskip("manim")
+from manim.utils.exceptions import EndSceneEarlyException
+from manim122lib.parallel import SECTIONS_DIR, SectionController, section_boundary, stitch_sections
+
+
+class FakeScene:
+    def __init__(self):
+        self.slides = 0
+
+    def play(self, *args, **kwargs):
+        pass
+
+    def wait(self, *args, **kwargs):
+        pass
+
+    def next_slide(self, *args, **kwargs):
+        self.slides += 1
+
+
+def test_boundary_does_nothing_in_a_normal_render():
+    scene = FakeScene()
+    section_boundary(scene, "intro")
+    assert scene.slides == 0
+
+
+def test_first_section_stops_at_the_first_boundary():
+    scene = FakeScene()
+    SectionController(scene, 0)
+    with pytest.raises(EndSceneEarlyException):
+        section_boundary(scene, "pq")
+
+
+def test_later_section_renders_from_its_boundary_to_the_next():
+    scene = FakeScene()
+    SectionController(scene, 1)
+    assert "play" in scene.__dict__
+    section_boundary(scene, "pq")
+    assert "play" not in scene.__dict__ and "next_slide" not in scene.__dict__
+    with pytest.raises(EndSceneEarlyException):
+        section_boundary(scene, "heap")
+
+
+def write_section(folder, section, names):
+    files = folder / SECTIONS_DIR / str(section) / "files" / "S"
+    files.mkdir(parents=True)
+    slides = []
+    for name in names:
+        (files / f"{name}.mp4").write_bytes(name.encode())
+        (files / f"{name}_reversed.mp4").write_bytes(name.encode())
+        slides.append({"file": str(files / f"{name}.mp4"), "rev_file": str(files / f"{name}_reversed.mp4")})
+    slides_path = folder / SECTIONS_DIR / str(section) / "S.json"
+    slides_path.write_text(json.dumps({"resolution": [1920, 1080], "slides": slides}))
+    return str(slides_path)
+
+
+def test_sections_are_stitched_in_order(tmp_path):
+    sections = [write_section(tmp_path, 0, ["a", "b"]), write_section(tmp_path, 1, ["c"])]
+    slides_path = stitch_sections(sections, "S", tmp_path)
+
+    presentation = json.loads(slides_path.read_text())
+    assert presentation["resolution"] == [1920, 1080]
+    files = tmp_path / "files" / "S"
+    assert [slide["file"] for slide in presentation["slides"]] == [str(files / f"{name}.mp4") for name in "abc"]
+    assert all((files / f"{name}_reversed.mp4").exists() for name in "abc")
+    assert not (tmp_path / SECTIONS_DIR).exists()
+
+
+def test_shared_forward_and_reversed_file_is_moved_once(tmp_path):
+    files = tmp_path / SECTIONS_DIR / "0"
+    files.mkdir(parents=True)
+    (files / "a.mp4").write_bytes(b"a")
+    (files / "S.json").write_text(json.dumps({"slides": [{"file": str(files / "a.mp4"), "rev_file": str(files / "a.mp4")}]}))
+    slide = json.loads(stitch_sections([str(files / "S.json")], "S", tmp_path).read_text())["slides"][0]
+    assert slide["file"] == slide["rev_file"] == str(tmp_path / "files" / "S" / "a.mp4")
+    assert (tmp_path / "files" / "S" / "a.mp4").read_bytes() == b"a"
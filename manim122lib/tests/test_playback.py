@@ -0,0 +1,47 @@
+import pytest
+
+manim = pytest.importorskip("manim")
+from manim import AnimationGroup, FadeIn, Square, RIGHT, RED
+from manim.animation.animation import prepare_animation
+from manim122lib.playback import _prune, prune_noop_animations
+
+
+def prune(*animations):
+    return _prune([prepare_animation(anim) for anim in animations])
+
+
+def test_animations_that_end_where_they_start_are_dropped():
+    square = Square()
+    assert prune(square.animate.move_to(square.get_center())) == []
+    assert prune(square.animate.set_color(square.get_color())) == []
+
+
+def test_animations_that_change_something_are_kept():
+    square = Square()
+    moved, recolored = prepare_animation(square.animate.shift(RIGHT)), prepare_animation(Square().animate.set_color(RED))
+    assert _prune([moved, recolored]) == [moved, recolored]
+
+
+def test_other_animation_types_are_always_kept():
+    fade = FadeIn(Square())
+    assert _prune([fade]) == [fade]
+
+
+def test_a_noop_last_transform_cancels_earlier_ones_on_the_same_mobject():
+    square = Square()
+    assert prune(square.animate.shift(RIGHT), square.animate.move_to(square.get_center())) == []
+
+
+def test_a_changing_last_transform_is_kept_over_an_earlier_noop():
+    square = Square()
+    noop, moved = prepare_animation(square.animate.move_to(square.get_center())), prepare_animation(square.animate.shift(RIGHT))
+    assert _prune([noop, moved]) == [moved]
+
+
+def test_plain_groups_are_unpacked_and_lagged_ones_kept():
+    square, other = Square(), Square()
+    moved = square.animate.shift(RIGHT)
+    kept = prune_noop_animations([AnimationGroup(moved, other.animate.move_to(other.get_center()))])
+    assert len(kept) == 1 and kept[0].mobject is square
+    lagged = AnimationGroup(Square().animate.shift(RIGHT), lag_ratio=0.5)
+    assert prune_noop_animations([lagged]) == [lagged]
@@ -0,0 +1,52 @@
+import struct
+import pytest
+from manim122lib.preload import mp4_duration
+
+
+def box(kind: bytes, payload: bytes = b"") -> bytes:
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def mvhd(timescale: int, duration: int, version: int = 0) -> bytes:
+    if version == 1:
+        fields = struct.pack(">QQIQ", 0, 0, timescale, duration)
+    else:
+        fields = struct.pack(">IIII", 0, 0, timescale, duration)
+    return box(b"mvhd", bytes([version, 0, 0, 0]) + fields + bytes(80))
+
+
+def write(tmp_path, data: bytes):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(data)
+    return path
+
+
+@pytest.mark.parametrize("version", [0, 1])
+def test_duration_is_read_from_mvhd(tmp_path, version):
+    data = box(b"ftyp", b"isom") + box(b"moov", mvhd(1000, 2500, version) + box(b"trak")) + box(b"mdat", bytes(64))
+    assert mp4_duration(write(tmp_path, data)) == 2.5
+
+
+def test_moov_after_a_64_bit_mdat(tmp_path):
+    mdat = struct.pack(">I4sQ", 1, b"mdat", 16 + 32) + bytes(32)
+    data = box(b"ftyp", b"isom") + mdat + box(b"moov", box(b"udta") + mvhd(600, 300))
+    assert mp4_duration(write(tmp_path, data)) == 0.5
+
+
+def test_box_running_to_the_end_of_file(tmp_path):
+    data = box(b"ftyp", b"isom") + struct.pack(">I4s", 0, b"moov") + mvhd(10, 35)
+    assert mp4_duration(write(tmp_path, data)) == 3.5
+
+
+@pytest.mark.parametrize("data", [
+    box(b"ftyp", b"isom") + box(b"mdat", bytes(16)),                 # no moov
+    box(b"moov", mvhd(0, 100)),                                      # zero timescale
+    box(b"ftyp", b"isom") + struct.pack(">I4s", 4, b"moov"),         # corrupt box size
+    box(b"moov", mvhd(1000, 2500)[:20]),                             # truncated mvhd
+    box(b"moov", mvhd(1000, 2500, version=1)[:36]),                  # truncated version 1 mvhd
+    box(b"moov", box(b"mvhd")),                                      # empty mvhd
+    struct.pack(">I4s", 1, b"mdat") + bytes(4),                      # truncated 64-bit size
+    b"",
+])
+def test_unreadable_durations_are_none(tmp_path, data):
+    assert mp4_duration(write(tmp_path, data)) is None
@@ -0,0 +1,77 @@
+import json
+import pytest
+from manim122lib.publish import ContentStore, file_digest, publish
+
+
+def write(path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+def test_identical_files_are_stored_once(tmp_path):
+    write(tmp_path / "a.mp4", b"same")
+    write(tmp_path / "b.mp4", b"same")
+    store = ContentStore(tmp_path)
+    stored = store.add("a.mp4")
+    assert store.add("b.mp4") == stored == f"assets/{file_digest(tmp_path / stored)}.mp4"
+    assert not (tmp_path / "a.mp4").exists() and not (tmp_path / "b.mp4").exists()
+    assert store.bytes_saved == 4
+    assert store.add(stored) == stored
+
+
+def test_manifest_survives_reopening(tmp_path):
+    write(tmp_path / "a.mp4", b"video")
+    store = ContentStore(tmp_path)
+    stored = store.add("a.mp4")
+    store.save()
+    reopened = ContentStore(tmp_path)
+    assert reopened.manifest == {"a.mp4": stored}
+    # The original is gone, but the manifest still resolves it
+    assert reopened.add("a.mp4") == stored
+
+
+def test_link_original_keeps_a_hardlink(tmp_path):
+    write(tmp_path / "a.mp4", b"video")
+    stored = ContentStore(tmp_path).add("a.mp4", link_original=True)
+    assert (tmp_path / "a.mp4").samefile(tmp_path / stored)
+
+
+def test_missing_unknown_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ContentStore(tmp_path).add("missing.mp4")
+
+
+def test_publish_rewrites_the_deck_and_prunes_stale_videos(tmp_path):
+    files = tmp_path / "slides" / "files" / "S"
+    write(files / "a.mp4", b"forward")
+    write(files / "a_reversed.mp4", b"backward")
+    write(files / "stale.mp4", b"old render")
+    write(tmp_path / "index_assets" / "a.mp4", b"forward")
+    (tmp_path / "slides" / "S.json").write_text(json.dumps({"slides": [{"file": "slides/files/S/a.mp4", "rev_file": "slides/files/S/a_reversed.mp4"}]}))
+    (tmp_path / "slides.html").write_text('<section data-background-video="index_assets/a.mp4"></section>')
+
+    store = publish(tmp_path, "S")
+
+    slide = json.loads((tmp_path / "slides" / "S.json").read_text())["slides"][0]
+    assert (tmp_path / slide["file"]).read_bytes() == b"forward"
+    assert (tmp_path / slide["rev_file"]).read_bytes() == b"backward"
+    assert f'data-background-video="{slide["file"]}"' in (tmp_path / "slides.html").read_text()
+    assert len(set(store.manifest.values())) == 2
+    assert not (tmp_path / "slides" / "files").exists()
+    assert not (tmp_path / "index_assets").exists()
+
+
+def test_publish_keeps_the_incremental_cache_valid(tmp_path):
+    write(tmp_path / "slides" / "files" / "S" / "a.mp4", b"forward")
+    entry = {"file": "slides/files/S/a.mp4", "rev_file": "slides/files/S/a.mp4"}
+    (tmp_path / "slides" / "S.json").write_text(json.dumps({"slides": [entry]}))
+    gone = {"file": "slides/files/S/gone.mp4", "rev_file": "slides/files/S/gone.mp4"}
+    cache_path = write(tmp_path / "slides" / ".incremental" / "S.json", json.dumps({"library": "x", "segments": {"a": entry, "b": gone}}).encode())
+
+    publish(tmp_path, "S")
+
+    segments = json.loads(cache_path.read_text())["segments"]
+    assert segments["a"]["file"].startswith("assets/") and (tmp_path / segments["a"]["file"]).exists()
+    assert segments["a"]["rev_file"] == segments["a"]["file"]
+    assert segments["b"] == gone
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+from manim import tempconfig
+from manim122lib.queue import PriorityQueue
+from manim122lib.recording import RecordingScene
+
+DATA = [15, 16, 19, 57]
+
+
+@pytest.fixture(autouse=True, scope="module")
+def media_dir(tmp_path_factory):
+    # Text labels are rendered to SVG files under the media dir
+    with tempconfig({"media_dir": str(tmp_path_factory.mktemp("media"))}):
+        yield
+
+
+@pytest.fixture
+def scene():
+    return RecordingScene()
+
+
+def assert_in_slots(pq):
+    """Elements hold the sorted data and sit in consecutive slots."""
+    assert [element.data for element in pq.elements] == pq.data == sorted(pq.data)
+    xs = [element.get_center()[0] for element in pq.elements]
+    assert np.allclose(np.diff(xs), pq.cfg.element_width + pq.cfg.element_spacing)
+
+
+def test_add_many_merges_the_values_in_order(scene):
+    pq = PriorityQueue(DATA, scene)
+    pq.pq_add_many(scene, [20, 3, 16])
+    assert pq.data == [3, 15, 16, 16, 19, 20, 57]
+    assert_in_slots(pq)
+
+
+@pytest.mark.parametrize("k", [1, 4])
+def test_add_many_makes_the_same_plays_for_any_count(scene, k):
+    pq = PriorityQueue(DATA, scene)
+    start = len(scene.calls)
+    pq.pq_add_many(scene, list(range(k)))
+    # Fade in, slide and shift, highlight, unhighlight
+    assert [call.kind for call in scene.calls[start:]] == ["play"] * 4
+
+
+def test_add_many_past_capacity_changes_nothing(scene):
+    pq = PriorityQueue(DATA, scene)
+    pq.pq_add_many(scene, list(range(pq.cfg.capacity)))
+    assert pq.data == DATA
+
+
+def test_rem_many_returns_the_front_values(scene):
+    pq = PriorityQueue(DATA, scene)
+    start = len(scene.calls)
+    assert pq.pq_rem_many(scene, 3) == [15, 16, 19]
+    assert [call.kind for call in scene.calls[start:]] == ["play", "play", "play", "wait", "play"]
+    assert pq.data == [57]
+    assert_in_slots(pq)
+    assert not any(element in pq.submobjects for element in scene.calls[-1].mobjects)
+
+
+def test_rem_many_clamps_the_count(scene):
+    pq = PriorityQueue(DATA, scene)
+    assert pq.pq_rem_many(scene, 0) == []
+    assert pq.pq_rem_many(scene, 10, hang_duration=0) == DATA
+    assert pq.data == [] and pq.elements == []
+    assert pq.pq_rem_many(scene, 1) == []
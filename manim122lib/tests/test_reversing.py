@@ -0,0 +1,118 @@
+import json
+from types import SimpleNamespace
+import pytest
+
+pytest.importorskip("manim_slides")
+from manim122lib import reversing
+from manim122lib.reversing import SelectiveReversing
+
+
+class FakeSlide:
+    """The parts of manim_slides' BaseSlide that SelectiveReversing relies on."""
+    max_duration_before_split_reverse = 4.0
+    num_processes = None
+    _leave_progress_bar = False
+    _show_progress_bar = False
+
+    def __init__(self, folder):
+        self._output_folder = folder
+        self._slides = []
+        self.saved_with = None
+
+    def __str__(self):
+        return "Deck"
+
+    def _add_last_slide(self):
+        pass
+
+    def play_slide(self, skip_animations: bool = False):
+        """Ends the slide in progress, as next_slide does."""
+        self._slides.append(SimpleNamespace(skip_animations=skip_animations))
+
+    def _save_slides(self, use_cache: bool = True, flush_cache: bool = False, skip_reversing: bool = False):
+        self.saved_with = skip_reversing
+        entries = []
+        for i, slide in enumerate(self._slides):
+            if slide.skip_animations: continue
+            video = self._output_folder / f"slide{i}.mp4"
+            video.write_bytes(b"forward")
+            entries.append({"file": str(video), "rev_file": str(video if skip_reversing else video.with_name(f"slide{i}_rev.mp4"))})
+        (self._output_folder / "Deck.json").write_text(json.dumps({"slides": entries}))
+
+
+class Deck(SelectiveReversing, FakeSlide):
+    pass
+
+
+@pytest.fixture
+def reversed_calls(monkeypatch):
+    calls = []
+
+    def reverse_video_file(src, dest, **kwargs):
+        dest.write_bytes(b"reversed")
+        calls.append((src, dest, kwargs))
+
+    monkeypatch.setattr(reversing, "reverse_video_file", reverse_video_file)
+    return calls
+
+
+def saved_slides(deck):
+    return json.loads((deck._output_folder / "Deck.json").read_text())["slides"]
+
+
+def test_only_marked_slides_get_a_reversed_video(tmp_path, reversed_calls):
+    deck = Deck(tmp_path)
+    deck.reversed_videos = "marked"
+    deck.play_slide()
+    deck.play_slide(skip_animations=True)
+    deck.mark_reversible()
+    deck.play_slide()
+    deck.play_slide()
+    deck._save_slides()
+
+    # Slide 2 is the second saved slide: the skipped slide 1 is not written
+    slides = saved_slides(deck)
+    assert deck.saved_with is True
+    assert [slide["rev_file"] == slide["file"] for slide in slides] == [True, False, True]
+    assert slides[1]["rev_file"] == str(tmp_path / "slide2_reversed.mp4")
+    assert [(src.name, dest.name) for src, dest, _ in reversed_calls] == [("slide2.mp4", "slide2_reversed.mp4")]
+    assert set(reversed_calls[0][2]) >= {"ascii", "disable", "leave", "num_processes", "max_segment_duration"}
+
+
+def test_marked_skipped_slide_is_ignored(tmp_path, reversed_calls):
+    deck = Deck(tmp_path)
+    deck.reversed_videos = "marked"
+    deck.mark_reversible()
+    deck.play_slide(skip_animations=True)
+    deck.play_slide()
+    deck._save_slides()
+    assert reversed_calls == []
+    assert all(slide["rev_file"] == slide["file"] for slide in saved_slides(deck))
+
+
+def test_existing_reversed_video_is_reused(tmp_path, reversed_calls):
+    (tmp_path / "slide0_reversed.mp4").write_bytes(b"reversed")
+    deck = Deck(tmp_path)
+    deck.reversed_videos = "marked"
+    deck.mark_reversible()
+    deck.play_slide()
+    deck._save_slides()
+    assert reversed_calls == []
+    assert saved_slides(deck)[0]["rev_file"] == str(tmp_path / "slide0_reversed.mp4")
+
+
+@pytest.mark.parametrize("policy, skip_reversing", [("none", True), ("all", False)])
+def test_none_and_all_policies(tmp_path, reversed_calls, policy, skip_reversing):
+    deck = Deck(tmp_path)
+    deck.reversed_videos = policy
+    deck.play_slide()
+    deck._save_slides()
+    assert deck.saved_with is skip_reversing
+    assert reversed_calls == []
+
+
+def test_unknown_policy_raises(tmp_path):
+    deck = Deck(tmp_path)
+    deck.reversed_videos = "some"
+    with pytest.raises(ValueError):
+        deck._save_slides()
@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip("manim")
+from manim import Circle, Create, FadeOut, Scene, tempconfig
+from manim122lib.timeline import TimelineRecorder, dry_run
+
+
+class Deck(Scene):
+    def construct(self):
+        circle = Circle()
+        self.play(Create(circle), run_time=2)
+        self.wait(0.5)
+        self.next_slide(notes="Fade out")
+        self.play(FadeOut(circle))
+
+
+def test_dry_run_reports_each_slide():
+    timeline = dry_run(Deck)
+    assert [(slide.index, slide.plays, slide.waits, slide.duration) for slide in timeline.slides] == [(1, 1, 1, 2.5), (2, 1, 0, 1.0)]
+    assert timeline.slides[1].notes == "Fade out"
+    assert timeline.duration == 3.5
+
+
+def test_recorder_keeps_its_own_time():
+    with tempconfig({"dry_run": True, "write_to_movie": False, "disable_caching": True}):
+        scene = Deck()
+        recorder = TimelineRecorder(scene).attach()
+        scene.construct()
+    assert recorder.time == 3.5
+    assert scene.renderer.time == 0
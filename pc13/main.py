@@ -9,7 +9,10 @@ class PQ(VMobject):
 
 
 
-class PC13(Slide):
+class PC13(SelectiveReversing, Slide):
+  # Going back restarts a slide instead of playing it in reverse, so no reversed videos are encoded
+  reversed_videos = "none"
+
   def announcements_slide(self, title):
         points = [
         "Final Review Session: Thursday July \n31st from 1pm to 4pm in TEP 1403",
@@ -45,6 +48,7 @@ class PC13(Slide):
     language="c"
     pq = PriorityQueue([15, 16, 19, 57], self)
     self.next_slide()
+    section_boundary(self, "pq")
     pq_add_code = Code(code_string="pq_add(pq, 14);", language=language, add_line_numbers=False).next_to(abstract_text, DOWN)
     pq_add_code.move_to([0, pq_add_code.get_center()[1], 0])
     self.play(Write(pq_add_code), Write(note2_text))
@@ -108,6 +112,7 @@ class PC13(Slide):
     heap_text1 = get_heap_text("Heaps are binary trees that store higher priority elements closer to the root. They have two important invariants: the shape invariant and the ordering invariant. Every operation we do must maintain these invariants. ").next_to(title, DOWN).to_edge(LEFT)
     self.play(Write(heap_text1), Write(note_text))
     self.next_slide()
+    section_boundary(self, "heap")
 
     shape_i_text = get_heap_text("Shape Invariant: complete binary tree (except maybe last level)").next_to(heap_text1, DOWN).to_edge(LEFT)
     ordering_i_text = get_heap_text("Ordering Invariant: parent ≤ children (min-heap)").next_to(shape_i_text, DOWN).to_edge(LEFT)
@@ -225,6 +230,7 @@ class PC13(Slide):
     self.play(Write(intro_title))
 
     self.next_slide()
+    section_boundary(self, "announcements")
     announcements_title = Text("Announcements", font="JetBrains Mono").to_edge(UP)
     self.play(Transform(intro_title, announcements_title))
 